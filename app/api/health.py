@@ -1,19 +1,25 @@
 """Health Check API - Service health monitoring."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter(tags=["Health"])
 
+# Static payload, serialized once at import
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "erp-sync",
+        "version": "1.0.0"
+    }
+)
+
 
 @router.get("/health")
-def health_check():
+def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns service status and basic information.
     """
-    return {
-        "status": "healthy",
-        "service": "erp-sync",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
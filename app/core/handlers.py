@@ -4,7 +4,8 @@ Global exception handlers.
 Converts exceptions into standardized JSON responses with proper status codes.
 """
 
-from fastapi import Request, status
+import orjson
+from fastapi import Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
@@ -15,6 +16,18 @@ from app.utils.response import error
 
 logger = get_logger(__name__)
 
+# Settings are frozen, so the debug flag is read once
+_DEBUG = settings.debug
+
+_VALIDATION_MESSAGE = "Invalid request parameters. Please check your input."
+_INTERNAL_ERROR_MESSAGE = (
+    "An unexpected error occurred. Please contact support if the issue persists."
+)
+
+# Production bodies carry no error detail, so they are serialized once
+_VALIDATION_BODY_PROD = orjson.dumps(error(message=_VALIDATION_MESSAGE))
+_INTERNAL_BODY_PROD = orjson.dumps(error(message=_INTERNAL_ERROR_MESSAGE))
+
 
 async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
     """
@@ -27,7 +40,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     Returns:
         JSONResponse: Standardized error response
     """
-    logger.error(f"AppException: {exc.message} (status: {exc.status_code})")
+    logger.error("AppException: %s (status: %s)", exc.message, exc.status_code)
     return JSONResponse(
         status_code=exc.status_code, content=error(message=exc.message)
     )
@@ -35,7 +48,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle Pydantic validation errors.
 
@@ -44,23 +57,28 @@ async def validation_exception_handler(
         exc: Validation exception
 
     Returns:
-        JSONResponse: Standardized validation error response
+        Response: Standardized validation error response
     """
-    logger.warning(f"Validation error: {exc.errors()}")
+    logger.warning("Validation error: %s", exc.errors())
 
     # Only expose validation details in debug mode
-    error_detail = str(exc.errors()) if settings.debug else None
+    if not _DEBUG:
+        return Response(
+            content=_VALIDATION_BODY_PROD,
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            media_type="application/json",
+        )
 
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error(
-            message="Invalid request parameters. Please check your input.",
-            error_detail=error_detail
+            message=_VALIDATION_MESSAGE,
+            error_detail=str(exc.errors())
         ),
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions.
 
@@ -69,18 +87,23 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc: Unexpected exception
 
     Returns:
-        JSONResponse: Standardized server error response
+        Response: Standardized server error response
     """
-    logger.exception(f"Unexpected error: {str(exc)}")
+    logger.exception("Unexpected error: %s", exc)
 
     # Only expose technical error details in debug mode
     # In production, hide details to prevent information leakage
-    error_detail = str(exc) if settings.debug else None
+    if not _DEBUG:
+        return Response(
+            content=_INTERNAL_BODY_PROD,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type="application/json",
+        )
 
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error(
-            message="An unexpected error occurred. Please contact support if the issue persists.",
-            error_detail=error_detail
+            message=_INTERNAL_ERROR_MESSAGE,
+            error_detail=str(exc)
         ),
     )
@@ -1,15 +1,70 @@
-import json
 import logging
+import os
+import secrets
 import sys
+import time
 from contextvars import ContextVar
-from datetime import datetime, timezone
 from typing import Any, Dict
 
+import orjson
+
 from app.core.settings import settings
 
+# Settings are frozen, so hot paths read plain module globals
+_APP_NAME = settings.app_name
+_DEBUG = settings.debug
+
 # Context variables for request tracking
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default=None)
 request_context_ctx: ContextVar[Dict] = ContextVar("request_context", default={})
+# The same context pre-serialized as JSON object members (no braces)
+_request_context_json: ContextVar[bytes] = ContextVar(
+    "request_context_json", default=b""
+)
+
+# orjson renders any datetime in extra fields as "YYYY-MM-DDTHH:MM:SSZ"
+# Non-str keys and unserializable values are stringified instead of raising
+_ORJSON_OPTIONS = (
+    orjson.OPT_UTC_Z
+    | orjson.OPT_NAIVE_UTC
+    | orjson.OPT_OMIT_MICROSECONDS
+    | orjson.OPT_NON_STR_KEYS
+)
+
+_ISO_TS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+_PLAIN_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Last rendered timestamp per format: {format: (epoch_second, rendered)}
+_TS_CACHE: Dict[str, tuple] = {}
+
+
+def _fmt_ts(created: float, fmt: str = _ISO_TS_FORMAT) -> str:
+    """
+    Format a record time as UTC, reusing the string rendered for the same second.
+
+    Args:
+        created: Epoch seconds (LogRecord.created)
+        fmt: strftime format string
+
+    Returns:
+        str: Formatted UTC timestamp
+    """
+    sec = int(created)
+    cached = _TS_CACHE.get(fmt)
+    if cached is not None and cached[0] == sec:
+        return cached[1]
+
+    rendered = time.strftime(fmt, time.gmtime(sec))
+    # Single dict store of an immutable tuple - atomic under the GIL
+    _TS_CACHE[fmt] = (sec, rendered)
+    return rendered
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """Get the log message, skipping %-interpolation when there are no args."""
+    if record.args:
+        return record.getMessage()
+    return str(record.msg)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -19,15 +74,20 @@ class StructuredFormatter(logging.Formatter):
     Outputs logs in machine-readable JSON format with all mandatory fields.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Static fields resolved once instead of per record
+        self._service = _APP_NAME
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         # Base log structure
         log_data = {
-            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "timestamp": _fmt_ts(record.created),
             "level": record.levelname,
-            "service": settings.app_name,
+            "service": self._service,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": _record_message(record),
         }
 
         # Add request context if available
@@ -35,10 +95,6 @@ class StructuredFormatter(logging.Formatter):
         if request_id:
             log_data["request_id"] = request_id
 
-        context = request_context_ctx.get()
-        if context:
-            log_data.update(context)
-
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
@@ -47,7 +103,20 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        # Fields set on the record win over request context keys of the same name
+        context = request_context_ctx.get()
+        if context and not context.keys().isdisjoint(log_data):
+            for key, value in context.items():
+                log_data.setdefault(key, value)
+            context = None
+
+        output = orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS)
+
+        # Splice in the request context serialized once per request
+        if context:
+            output = b"".join((output[:-1], b",", _request_context_json.get(), b"}"))
+
+        return output.decode()
 
 
 class PlainFormatter(logging.Formatter):
@@ -55,11 +124,34 @@ class PlainFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as plain text."""
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _fmt_ts(record.created, _PLAIN_TS_FORMAT)
         request_id = request_id_ctx.get()
         req_id_str = f"[{request_id}]" if request_id else ""
 
-        return f"{timestamp} - {record.levelname} - {record.name}{req_id_str} - {record.getMessage()}"
+        return f"{timestamp} - {record.levelname} - {record.name}{req_id_str} - {_record_message(record)}"
+
+
+class BytesJsonHandler(logging.Handler):
+    """
+    Handler that writes formatted records straight to a file descriptor.
+
+    Pairs with StructuredFormatter: one os.write per record, with no
+    text-layer buffering or separate newline write.
+    """
+
+    def __init__(self, fd: int = 1):
+        super().__init__()
+        self._fd = fd
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the formatted record."""
+        try:
+            data = memoryview((self.format(record) + "\n").encode())
+            # Pipes and non-blocking stdout may accept only part of the line
+            while data:
+                data = data[os.write(self._fd, data):]
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging():
@@ -68,18 +160,17 @@ def setup_logging():
 
     Uses JSON logging in production, plain text in debug mode.
     """
-    log_level = logging.DEBUG if settings.debug else logging.INFO
+    log_level = logging.DEBUG if _DEBUG else logging.INFO
 
-    # Choose formatter based on environment
-    if settings.debug:
-        formatter = PlainFormatter()
+    # Choose handler and formatter based on environment
+    if _DEBUG:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(PlainFormatter())
     else:
-        formatter = StructuredFormatter()
+        handler = BytesJsonHandler(sys.stdout.fileno())
+        handler.setFormatter(StructuredFormatter())
 
     # Configure root logger
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-
     logging.basicConfig(
         level=log_level,
         handlers=[handler],
@@ -92,7 +183,7 @@ def setup_logging():
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
     # Suppress uvicorn logs in production only
-    if not settings.debug:
+    if not _DEBUG:
         logging.getLogger("uvicorn").setLevel(logging.WARNING)
         logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
@@ -121,9 +212,46 @@ def set_request_context(request_id: str, context: Dict[str, Any] = None):
     request_id_ctx.set(request_id)
     if context:
         request_context_ctx.set(context)
+        _request_context_json.set(
+            orjson.dumps(context, default=str, option=_ORJSON_OPTIONS)[1:-1]
+        )
 
 
 def clear_request_context():
     """Clear request context after request completion."""
     request_id_ctx.set(None)
     request_context_ctx.set({})
+    _request_context_json.set(b"")
+
+
+def new_request_id() -> str:
+    """
+    Generate a short request identifier.
+
+    Returns:
+        str: 8 random hex characters (same width as the previous uuid4 prefix)
+    """
+    return secrets.token_hex(4)
+
+
+def start_request_timer() -> int:
+    """
+    Start timing a request.
+
+    Returns:
+        int: Monotonic start time in nanoseconds
+    """
+    return time.monotonic_ns()
+
+
+def elapsed_ms(start_ns: int) -> int:
+    """
+    Get whole milliseconds elapsed since start_request_timer().
+
+    Args:
+        start_ns: Value returned by start_request_timer()
+
+    Returns:
+        int: Elapsed milliseconds (integer arithmetic, no float conversion)
+    """
+    return (time.monotonic_ns() - start_ns) // 1_000_000
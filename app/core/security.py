@@ -1,9 +1,14 @@
+import hashlib
+import threading
+import time
 from typing import Dict
 
 import jwt
+from cachetools import TTLCache
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from fastapi import Header
+from jwt.algorithms import RSAAlgorithm
 from pydantic import BaseModel
 
 from app.core.exceptions import UnauthorizedException
@@ -23,6 +28,10 @@ class JWTClaims(BaseModel):
     nbf: int | None = None
 
 
+_PEM_HEADER = b"-----BEGIN PUBLIC KEY-----\n"
+_PEM_FOOTER = b"\n-----END PUBLIC KEY-----"
+
+
 # Load and parse the RSA public key
 def _load_public_key():
     """Load the RSA public key for JWT verification."""
@@ -31,18 +40,21 @@ def _load_public_key():
         raise ValueError("PUBLIC_KEY is not configured")
 
     try:
-        public_key_pem = f"""-----BEGIN PUBLIC KEY-----
-{settings.public_key}
------END PUBLIC KEY-----"""
+        # Accept either a full PEM block or just the base64 key body
+        if "BEGIN PUBLIC KEY" in settings.public_key:
+            pem_bytes = settings.public_key.strip().encode("utf-8")
+        else:
+            pem_bytes = (
+                _PEM_HEADER + settings.public_key.strip().encode("utf-8") + _PEM_FOOTER
+            )
 
-        clean_key = public_key_pem.strip()
         public_key_obj = serialization.load_pem_public_key(
-            clean_key.encode("utf-8"), backend=default_backend()
+            pem_bytes, backend=default_backend()
         )
         logger.info("Public key loaded successfully")
         return public_key_obj
     except ValueError as e:
-        logger.fatal(f"Failed to parse public key: {e}")
+        logger.fatal("Failed to parse public key: %s", e)
         raise ValueError(f"Failed to parse public key: {e}")
 
 
@@ -54,6 +66,78 @@ except ValueError:
     PUBLIC_KEY_OBJ = None
     logger.warning("Running without public key - authentication will fail")
 
+# Key and decode arguments prepared once instead of on every request
+PREPARED_KEY = (
+    RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(PUBLIC_KEY_OBJ)
+    if PUBLIC_KEY_OBJ
+    else None
+)
+_ALGORITHMS = ("RS256",)
+_DECODE_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_nbf": True,
+    "verify_iat": True,
+    "verify_aud": False,
+    "verify_iss": False,
+}
+
+_BEARER_PREFIX = "Bearer "
+_BEARER_LEN = len(_BEARER_PREFIX)
+
+# Error messages shared by every verify_token failure path
+_MSG_MISSING_HEADER = "Missing Authorization header"
+_MSG_INVALID_FORMAT = "Invalid Authorization header format"
+_MSG_NOT_CONFIGURED = "Authentication not configured"
+_MSG_TOKEN_EXPIRED = "Token has expired"
+_MSG_INVALID_SIGNATURE = "Invalid token signature"
+_MSG_AUTH_FAILED = "Authentication failed"
+
+# Verified claims keyed by a digest of the full Authorization header, so
+# repeated bearer tokens skip both the prefix check and the RSA signature
+# check. Entries are still re-checked against "exp" on hit.
+_TOKEN_CACHE_TTL_SECONDS = 60
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=_TOKEN_CACHE_TTL_SECONDS)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _token_cache_key(authorization: str) -> bytes:
+    """Hash a raw Authorization header into a compact cache key."""
+    return hashlib.blake2b(authorization.encode(), digest_size=16).digest()
+
+
+def _get_cached_claims(cache_key: bytes) -> Dict | None:
+    """
+    Get previously verified claims if they have not expired.
+
+    Args:
+        cache_key: Header digest from _token_cache_key
+
+    Returns:
+        Dict | None: Copy of cached claims, or None on miss/expiry
+    """
+    with _TOKEN_CACHE_LOCK:
+        claims = _TOKEN_CACHE.get(cache_key)
+
+    if claims is None:
+        return None
+
+    exp = claims.get("exp")
+    if exp is not None and exp <= time.time():
+        return None
+
+    return dict(claims)
+
+
+def _cache_claims(cache_key: bytes, claims: Dict) -> None:
+    """Cache verified claims, skipping tokens that are about to expire."""
+    exp = claims.get("exp")
+    if exp is not None and exp <= time.time():
+        return
+
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[cache_key] = dict(claims)
+
 
 def verify_token(authorization: str = Header(None)) -> Dict:
     """
@@ -72,54 +156,58 @@ def verify_token(authorization: str = Header(None)) -> Dict:
     """
     if not authorization:
         logger.warning("No Authorization header found")
-        raise UnauthorizedException(message="Missing Authorization header")
+        raise UnauthorizedException(message=_MSG_MISSING_HEADER)
+
+    # Only fully validated headers are cached, so a hit needs no further checks
+    cache_key = _token_cache_key(authorization)
+    cached_claims = _get_cached_claims(cache_key)
+    if cached_claims is not None:
+        return cached_claims
 
-    if not authorization.startswith("Bearer "):
-        logger.warning(f"Invalid Authorization header format: {authorization}")
-        raise UnauthorizedException(message="Invalid Authorization header format")
+    # Single slice compare instead of startswith + split
+    if (
+        len(authorization) <= _BEARER_LEN
+        or authorization[:_BEARER_LEN] != _BEARER_PREFIX
+    ):
+        logger.warning("Invalid Authorization header format: %s", authorization)
+        raise UnauthorizedException(message=_MSG_INVALID_FORMAT)
 
-    token = authorization.split(" ")[1]
+    token = authorization[_BEARER_LEN:]
 
-    if not PUBLIC_KEY_OBJ:
+    if not PREPARED_KEY:
         logger.error("Public key not loaded")
-        raise UnauthorizedException(message="Authentication not configured")
+        raise UnauthorizedException(message=_MSG_NOT_CONFIGURED)
 
     try:
         claims = jwt.decode(
             token,
-            PUBLIC_KEY_OBJ,
-            algorithms=["RS256"],
-            options={
-                "verify_signature": True,
-                "verify_exp": True,
-                "verify_nbf": True,
-                "verify_iat": True,
-                "verify_aud": False,
-                "verify_iss": False,
-            },
+            PREPARED_KEY,
+            algorithms=_ALGORITHMS,
+            options=_DECODE_OPTIONS,
         )
-        logger.debug(f"Token verified successfully for user: {claims.get('user_name')}")
+        logger.debug("Token verified successfully for user: %s", claims.get("user_name"))
+        _cache_claims(cache_key, claims)
         return claims
 
     except jwt.ExpiredSignatureError:
         logger.warning("Token has expired")
-        raise UnauthorizedException(message="Token has expired")
+        raise UnauthorizedException(message=_MSG_TOKEN_EXPIRED)
 
     except jwt.InvalidSignatureError:
         logger.warning("Invalid token signature")
-        raise UnauthorizedException(message="Invalid token signature")
+        raise UnauthorizedException(message=_MSG_INVALID_SIGNATURE)
 
     except jwt.DecodeError as e:
-        logger.warning(f"Token decode error: {e}")
+        logger.warning("Token decode error: %s", e)
         raise UnauthorizedException(message=f"Token decode error: {str(e)}")
 
     except jwt.InvalidTokenError as e:
-        logger.warning(f"Invalid token: {e}")
+        logger.warning("Invalid token: %s", e)
         raise UnauthorizedException(message=str(e))
 
     except Exception as e:
-        logger.error(f"Unexpected error during JWT validation: {e}")
-        raise UnauthorizedException(message="Authentication failed")
+        logger.error("Unexpected error during JWT validation: %s", e)
+        raise UnauthorizedException(message=_MSG_AUTH_FAILED)
 
 
 def get_current_user(claims: Dict = None) -> JWTClaims:
@@ -1,7 +1,12 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    # Frozen: configuration is read once at startup and never mutated
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
     app_name: str = "Lean FastAPI PocketBase"
     debug: bool = False
 
@@ -11,6 +16,9 @@ class Settings(BaseSettings):
 
     # SQL Interface Configuration (direct SQLite access)
     sql_interface_url: str | None = None
+    # Speak HTTP/2 without ALPN (h2c prior knowledge) for plain http:// URLs;
+    # https:// URLs negotiate HTTP/2 automatically
+    sql_interface_h2_prior_knowledge: bool = False
 
     # Plant Configuration (for multi-tenant collection naming)
     plant_code: str = "DEFAULT"
@@ -28,8 +36,23 @@ class Settings(BaseSettings):
     erp_sync_days_back: int | None = None  # Optional - only use if set
     erp_sync_from_date: str | None = None  # Optional - only use if set
 
-    class Config:
-        env_file = ".env"
+    # Job processing poll delay in seconds: backs off from min to max while idle
+    process_poll_min: float = 0.1
+    process_poll_max: float = 5.0
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings instance.
+
+    The .env file is parsed on the first call only; tests can force a
+    reload with get_settings.cache_clear().
+
+    Returns:
+        Settings: Application settings
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
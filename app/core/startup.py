@@ -7,6 +7,7 @@ when the application starts and cleanup when it shuts down.
 
 from app.core.logging import get_logger
 from app.db.client import pb
+from app.db.sql_client import sql_db
 
 logger = get_logger(__name__)
 
@@ -18,7 +19,7 @@ def init_job_sync_db() -> None:
 
         init_database()
     except Exception as e:
-        logger.error(f"❌ Failed to initialize job sync database: {e}")
+        logger.error("❌ Failed to initialize job sync database: %s", e)
 
 
 def start_scheduler() -> None:
@@ -29,7 +30,7 @@ def start_scheduler() -> None:
         scheduler.start(run_immediately=True)
         logger.info("✅ ERP sync scheduler started with initial sync")
     except Exception as e:
-        logger.error(f"❌ Failed to start scheduler: {e}")
+        logger.error("❌ Failed to start scheduler: %s", e)
 
 
 def startup() -> None:
@@ -48,16 +49,16 @@ def startup() -> None:
         pb.auth_admin()
         logger.info("✅ PocketBase authenticated successfully")
     except ConnectionError as e:
-        logger.error(f"❌ PocketBase connection failed: {e}")
+        logger.error("❌ PocketBase connection failed: %s", e)
         logger.warning(
             "Application will start but PocketBase features won't work. "
             "Start PocketBase and restart the app."
         )
     except ValueError as e:
-        logger.error(f"❌ PocketBase configuration error: {e}")
+        logger.error("❌ PocketBase configuration error: %s", e)
         logger.warning("Check your .env file for PB_ADMIN_EMAIL and PB_ADMIN_PASSWORD")
     except Exception as e:
-        logger.error(f"❌ Unexpected error during PocketBase auth: {e}")
+        logger.error("❌ Unexpected error during PocketBase auth: %s", e)
 
     init_job_sync_db()
     start_scheduler()
@@ -80,4 +81,28 @@ async def shutdown() -> None:
         await scheduler.stop()
         logger.info("✅ ERP sync scheduler stopped")
     except Exception as e:
-        logger.error(f"❌ Failed to stop scheduler: {e}")
+        logger.error("❌ Failed to stop scheduler: %s", e)
+
+    try:
+        from app.features.job_sync import repo
+
+        repo.close()
+    except Exception as e:
+        logger.error("❌ Failed to close ERP API client: %s", e)
+
+    try:
+        from app.features.job_sync.db_schema import close_connection
+
+        close_connection()
+    except Exception as e:
+        logger.error("❌ Failed to close job sync database: %s", e)
+
+    try:
+        await pb.aclose()
+    except Exception as e:
+        logger.error("❌ Failed to close PocketBase client: %s", e)
+
+    try:
+        sql_db.close()
+    except Exception as e:
+        logger.error("❌ Failed to close SQL interface client: %s", e)
@@ -1,3 +1,8 @@
+import asyncio
+import logging
+import re
+from typing import Any
+
 import httpx
 
 from app.core.logging import get_logger
@@ -5,12 +10,41 @@ from app.core.settings import settings
 
 logger = get_logger(__name__)
 
+# Maximum page requests in flight for get_full_list_async
+MAX_CONCURRENT_PAGES = 8
+
+# "{:name}" placeholders in filter templates (same syntax as the JS SDK)
+_FILTER_PLACEHOLDER_RE = re.compile(r"\{:(\w+)\}")
+
+
+def _filter_literal(value: Any) -> str:
+    """Render a Python value as a PocketBase filter literal."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "\\'") + "'"
+
 
 class PocketBaseClient:
     def __init__(self):
         self.base_url = settings.pocketbase_url.rstrip("/")
         self.token: str | None = None
         self.timeout = 15
+        # Persistent clients so TCP/TLS handshakes are amortized across calls
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        self._async_client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
 
     def auth_admin(self) -> None:
         """
@@ -26,13 +60,12 @@ class PocketBaseClient:
             )
 
         try:
-            response = httpx.post(
-                f"{self.base_url}/api/collections/_superusers/auth-with-password",
+            response = self._client.post(
+                "api/collections/_superusers/auth-with-password",
                 json={
                     "identity": settings.pb_admin_email,
                     "password": settings.pb_admin_password,
                 },
-                timeout=self.timeout,
             )
             response.raise_for_status()
             self.token = response.json()["token"]
@@ -49,11 +82,27 @@ class PocketBaseClient:
         except Exception as e:
             raise Exception(f"Unexpected error during PocketBase authentication: {str(e)}")
 
+    @staticmethod
+    def filter(expr: str, params: dict[str, Any]) -> str:
+        """
+        Bind {:name} placeholders in a filter template, like pb.filter() in
+        the PocketBase JS SDK.
+
+        Args:
+            expr: Filter template, e.g. "name={:name} && age>{:age}"
+            params: Values for the placeholders; strings are quoted and escaped
+
+        Returns:
+            str: Filter expression safe to send as the filter parameter
+        """
+        return _FILTER_PLACEHOLDER_RE.sub(
+            lambda match: _filter_literal(params[match.group(1)]), expr
+        )
+
     def auth_user(self, collection: str, identity: str, password: str) -> dict:
-        response = httpx.post(
-            f"{self.base_url}/api/collections/{collection}/auth-with-password",
+        response = self._client.post(
+            f"api/collections/{collection}/auth-with-password",
             json={"identity": identity, "password": password},
-            timeout=self.timeout,
         )
         response.raise_for_status()
         return response.json()
@@ -72,29 +121,34 @@ class PocketBaseClient:
         if auth_required and self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
-        url = f"{self.base_url}/api/{path.lstrip('/')}"
+        api_path = f"api/{path.lstrip('/')}"
 
-        # Build query string for logging
-        query_string = ""
+        # httpx would send None values as empty params, so drop them once here
         if params:
-            filtered_params = {k: v for k, v in params.items() if v is not None}
-            if filtered_params:
-                query_parts = [f"{k}={v}" for k, v in filtered_params.items()]
-                query_string = "?" + "&".join(query_parts)
+            params = {k: v for k, v in params.items() if v is not None}
 
-        logger.info(f"PocketBase API call: {method} {url}{query_string}")
+        # Only build the log line when INFO is actually emitted
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            query_string = ""
+            if params:
+                query_string = "?" + "&".join(f"{k}={v}" for k, v in params.items())
+            logger.info(
+                "PocketBase API call: %s %s/%s%s",
+                method, self.base_url, api_path, query_string,
+            )
 
-        response = httpx.request(
+        response = self._client.request(
             method=method,
-            url=url,
+            url=api_path,
             params=params,
             json=json,
             headers=headers,
-            timeout=self.timeout,
         )
 
         response.raise_for_status()
-        logger.info(f"PocketBase API response: status={response.status_code}")
+        if log_info:
+            logger.info("PocketBase API response: status=%s", response.status_code)
         return response.json()
 
     def get_full_list(
@@ -132,7 +186,107 @@ class PocketBaseClient:
             page += 1
 
         logger.info(
-            f"PocketBase collection '{collection}': retrieved {len(items)} records"
+            "PocketBase collection '%s': retrieved %d records", collection, len(items)
+        )
+        return items
+
+    def close(self) -> None:
+        """Close the persistent sync HTTP client."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close both persistent HTTP clients."""
+        self.close()
+        await self._async_client.aclose()
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None = None,
+        json: dict | None = None,
+        auth_required: bool = True,
+    ) -> dict:
+        """Async variant of request() using the shared AsyncClient."""
+        headers = {}
+
+        if auth_required and self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        url = f"{self.base_url}/api/{path.lstrip('/')}"
+        logger.info("PocketBase API call: %s %s", method, url)
+
+        response = await self._async_client.request(
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            headers=headers,
+        )
+
+        response.raise_for_status()
+        logger.info("PocketBase API response: status=%s", response.status_code)
+        return response.json()
+
+    async def get_full_list_async(
+        self,
+        collection: str,
+        *,
+        filter: str | None = None,
+        expand: str | None = None,
+        sort: str | None = None,
+        per_page: int = 200,
+    ) -> list[dict]:
+        """
+        Get all records of a collection, fetching pages concurrently.
+
+        The first page reveals totalPages; the remaining pages are then
+        requested in parallel with at most MAX_CONCURRENT_PAGES in flight.
+
+        Args:
+            collection: Collection name
+            filter: PocketBase filter expression
+            expand: Relations to expand
+            sort: Sort expression
+            per_page: Records per page
+
+        Returns:
+            list[dict]: All records, in page order
+        """
+        path = f"collections/{collection}/records"
+        base_params = {
+            k: v
+            for k, v in {
+                "perPage": per_page,
+                "filter": filter,
+                "expand": expand,
+                "sort": sort,
+            }.items()
+            if v
+        }
+
+        first_page = await self.arequest("GET", path, params={**base_params, "page": 1})
+        total_pages = first_page.get("totalPages", 1)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch_page(page: int) -> dict:
+            async with semaphore:
+                return await self.arequest(
+                    "GET", path, params={**base_params, "page": page}
+                )
+
+        remaining_pages = await asyncio.gather(
+            *(fetch_page(page) for page in range(2, total_pages + 1))
+        )
+
+        items: list[dict] = list(first_page.get("items", []))
+        for response in remaining_pages:
+            items.extend(response.get("items", []))
+
+        logger.info(
+            "PocketBase collection '%s': retrieved %d records across %d page(s)",
+            collection, len(items), total_pages,
         )
         return items
 
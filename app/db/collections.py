@@ -17,6 +17,8 @@ Usage:
     pb.get_full_list(CollectionNames.ERP_SOURCE)  # Returns: "ASWNDUBAI_erpConsolidateData"
 """
 
+import sys
+
 from app.core.logging import get_logger
 from app.core.settings import settings
 
@@ -94,6 +96,9 @@ class CollectionNames:
     """
     Ready-to-use collection names with PLANT_CODE prefix applied.
 
+    Names are resolved once at import (PLANT_CODE does not change at
+    runtime), so each access is a plain attribute load.
+
     **RECOMMENDED USAGE**: Import and use these constants everywhere.
 
     Usage:
@@ -111,17 +116,13 @@ class CollectionNames:
     """
 
     # ERP Source Data Collections
-    ERP_SOURCE = property(lambda self: get_collection(COLLECTION_BASE_NAMES.ERP_SOURCE))
+    ERP_SOURCE = sys.intern(get_collection(COLLECTION_BASE_NAMES.ERP_SOURCE))
 
     # Sync Management Collections
-    SYNC_LOG = property(lambda self: get_collection(COLLECTION_BASE_NAMES.SYNC_LOG))
-    SYNC_CONFIG = property(lambda self: get_collection(COLLECTION_BASE_NAMES.SYNC_CONFIG))
-    SYNC_ERROR = property(lambda self: get_collection(COLLECTION_BASE_NAMES.SYNC_ERROR))
+    SYNC_LOG = sys.intern(get_collection(COLLECTION_BASE_NAMES.SYNC_LOG))
+    SYNC_CONFIG = sys.intern(get_collection(COLLECTION_BASE_NAMES.SYNC_CONFIG))
+    SYNC_ERROR = sys.intern(get_collection(COLLECTION_BASE_NAMES.SYNC_ERROR))
 
     # System Collections
-    REPORTS = property(lambda self: get_collection(COLLECTION_BASE_NAMES.REPORTS))
-    LOGS = property(lambda self: get_collection(COLLECTION_BASE_NAMES.LOGS))
-
-
-# Singleton instance for easy access
-collections = CollectionNames()
+    REPORTS = sys.intern(get_collection(COLLECTION_BASE_NAMES.REPORTS))
+    LOGS = sys.intern(get_collection(COLLECTION_BASE_NAMES.LOGS))
@@ -15,18 +15,321 @@ Usage:
     )
 """
 
-import urllib.parse
-from typing import List, Dict
+import asyncio
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, List, Dict
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from app.core.logging import get_logger
 from app.core.settings import settings
 
 logger = get_logger(__name__)
 
+# Maximum page queries in flight for AsyncSQLiteInterfaceClient
+MAX_CONCURRENT_QUERIES = 16
+
+# get_full_list page sizes at or above this are fetched with one unbounded query
+SINGLE_QUERY_THRESHOLD = 5000
+
+# Opted-in read results are memoized per query text for a short time; the
+# cache is bounded by total rows held, and larger results are never cached
+RESPONSE_CACHE_MAX_ROWS = 10_000
+RESPONSE_CACHE_TTL_SECONDS = 30
+
+# Connect errors and 5xx responses are retried with jittered exponential backoff
+RETRY_ATTEMPTS = 4
+RETRY_MIN_WAIT_SECONDS = 0.2
+RETRY_MAX_WAIT_SECONDS = 5.0
+_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.RemoteProtocolError)
+
+# More than this many consecutive failures within the window opens the breaker
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_WINDOW_SECONDS = 30.0
+
+# Window-function column carrying the total row count on every page row
+_TOTAL_COLUMN = "__total"
+_TOTAL_SELECT = f"COUNT(*) OVER () AS {_TOTAL_COLUMN}"
+
+
+# Filter/sort strings repeat on every page, so their translations are cached
+@lru_cache(maxsize=512)
+def _pb_filter_to_sql(pb_filter: str) -> str:
+    """Translate a PocketBase filter into a SQL WHERE clause."""
+    try:
+        # Replace PocketBase operators with SQL operators
+        sql_filter = pb_filter.replace("&&", "AND")
+        sql_filter = sql_filter.replace("||", "OR")
+        sql_filter = sql_filter.replace("!=", "<>")
+
+        # Handle relation field syntax: "jobId.workOrderNumber" → "workOrderNumber"
+        # This assumes the relation is already expanded or denormalized
+        # TODO: Handle complex joins if needed
+        if "." in sql_filter:
+            logger.debug(f"Filter contains relation syntax (.), may need adjustment: {sql_filter}")
+
+        return sql_filter
+
+    except Exception as e:
+        logger.error(f"Error converting filter to SQL: {e}")
+        return ""
+
+
+@lru_cache(maxsize=512)
+def _pb_sort_to_sql(pb_sort: str) -> str:
+    """Translate a PocketBase sort ("-created,name") into a SQL ORDER BY clause."""
+    try:
+        sql_parts = []
+
+        for field in pb_sort.split(","):
+            field = field.strip()
+            if field.startswith("-"):
+                # Descending order
+                sql_parts.append(f"{field[1:]} DESC")
+            else:
+                # Ascending order (default)
+                sql_parts.append(f"{field} ASC")
+
+        return ", ".join(sql_parts)
+
+    except Exception as e:
+        logger.error(f"Error converting sort to SQL: {e}")
+        return ""
+
+
+# Table names are interpolated into SQL, so only plain identifiers are allowed
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@lru_cache(maxsize=256)
+def _validate_table(collection: str) -> str:
+    """
+    Check that a collection name is a plain SQL identifier.
+
+    Args:
+        collection: Table name
+
+    Returns:
+        The unchanged table name
+
+    Raises:
+        ValueError: If the name contains anything but letters, digits and "_"
+    """
+    if not _IDENTIFIER_RE.fullmatch(collection):
+        raise ValueError(f"Invalid collection name: {collection!r}")
+    return collection
+
+
+def _sql_literal(value: Any) -> str:
+    """Render a value as a single-quoted SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Jittered exponential wait before retrying after failed attempt N (1-based)."""
+    ceiling = min(RETRY_MAX_WAIT_SECONDS, RETRY_MIN_WAIT_SECONDS * 2 ** attempt)
+    return random.uniform(RETRY_MIN_WAIT_SECONDS, ceiling)
+
+
+def _http_version_options() -> Dict[str, bool]:
+    """
+    Get httpx HTTP version flags for SQL interface clients.
+
+    httpx only negotiates HTTP/2 through TLS ALPN, so a plain http:// SQL
+    interface would stay on HTTP/1.1 unless prior knowledge is enabled.
+    Over HTTP/2, concurrent page and count queries multiplex on one socket.
+
+    Returns:
+        Keyword arguments for httpx.Client / httpx.AsyncClient
+    """
+    return {
+        "http1": not settings.sql_interface_h2_prior_knowledge,
+        "http2": True,
+    }
+
+
+def _pop_total(rows: List[Dict]) -> int | None:
+    """
+    Strip the window-function total from page rows.
+
+    Args:
+        rows: Rows selected with _TOTAL_SELECT
+
+    Returns:
+        Total row count, or None if the page is empty
+    """
+    if not rows:
+        return None
+
+    total = rows[0].get(_TOTAL_COLUMN, 0)
+    for row in rows:
+        row.pop(_TOTAL_COLUMN, None)
+    return total
+
+
+def _stable_sort(sort: str | None) -> str:
+    """Append the id keyset column so OFFSET pages never overlap or skip rows."""
+    return f"{sort},id" if sort else "id"
+
+
+def _map_query_error(e: Exception, base_url: str | None) -> Exception:
+    """
+    Log a failed SQL interface call and map it to the error callers expect.
+
+    Args:
+        e: Error raised while sending the query or parsing its response
+        base_url: SQL interface URL, for connection errors
+
+    Returns:
+        ConnectionError if the interface is unreachable, Exception otherwise
+    """
+    if isinstance(e, httpx.HTTPStatusError):
+        logger.error(f"SQL query failed: HTTP {e.response.status_code} - {e.response.text}")
+        return Exception(f"SQL query failed: {e.response.status_code}")
+
+    if isinstance(e, httpx.ConnectError):
+        logger.error(f"Cannot connect to SQL interface at {base_url}: {e}")
+        return ConnectionError(f"Cannot connect to SQL interface: {str(e)}")
+
+    logger.error(f"SQL query error: {str(e)}")
+    return Exception(f"SQL query execution failed: {str(e)}")
+
+
+class _SQLQueryBuilder:
+    """PocketBase-to-SQL translation shared by the sync and async clients."""
+
+    def _convert_filter_to_sql(self, pb_filter: str) -> str:
+        """
+        Convert PocketBase filter syntax to SQL WHERE clause.
+
+        Args:
+            pb_filter: PocketBase filter (e.g., 'status = "active" && priority > 5')
+
+        Returns:
+            SQL WHERE clause (e.g., "status = 'active' AND priority > 5")
+        """
+        if not pb_filter:
+            return ""
+        return _pb_filter_to_sql(pb_filter)
+
+    def _convert_sort_to_sql(self, pb_sort: str) -> str:
+        """
+        Convert PocketBase sort syntax to SQL ORDER BY clause.
+
+        Args:
+            pb_sort: PocketBase sort (e.g., "-created" for DESC, "name,id" for multiple)
+
+        Returns:
+            SQL ORDER BY clause (e.g., "created DESC", "name ASC, id ASC")
+        """
+        if not pb_sort:
+            return ""
+        return _pb_sort_to_sql(pb_sort)
+
+    def _build_select_query(
+        self,
+        collection: str,
+        *,
+        filter: str | None,
+        sort: str | None,
+        columns: str = "*",
+    ) -> str:
+        """Build an unbounded SELECT with optional WHERE and ORDER BY."""
+        query_parts = [f"SELECT {columns} FROM {_validate_table(collection)}"]
+
+        if filter:
+            sql_where = self._convert_filter_to_sql(filter)
+            if sql_where:
+                query_parts.append(f"WHERE {sql_where}")
+
+        if sort:
+            sql_order = self._convert_sort_to_sql(sort)
+            if sql_order:
+                query_parts.append(f"ORDER BY {sql_order}")
+
+        return " ".join(query_parts)
+
+    def _build_keyset_query(
+        self,
+        collection: str,
+        filter: str | None,
+        last_id: str | None,
+        per_page: int,
+    ) -> str:
+        """
+        Build a keyset page query: rows after last_id in id order.
+
+        Args:
+            collection: Table name
+            filter: PocketBase-style filter, ANDed with the keyset predicate
+            last_id: Last id of the previous page (None for the first page)
+            per_page: Records per page
+
+        Returns:
+            SQL query string
+        """
+        conditions = []
+
+        sql_where = self._convert_filter_to_sql(filter) if filter else ""
+        if sql_where:
+            conditions.append(f"({sql_where})")
+
+        if last_id is not None:
+            conditions.append(f"id > {_sql_literal(last_id)}")
+
+        query = f"SELECT * FROM {_validate_table(collection)}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return f"{query} ORDER BY id LIMIT {per_page}"
+
+    def _build_page_query(
+        self,
+        collection: str,
+        *,
+        filter: str | None,
+        sort: str | None,
+        page: int,
+        per_page: int,
+        with_total: bool = False,
+    ) -> str:
+        """
+        Build a LIMIT/OFFSET query for one page of a collection.
+
+        Args:
+            collection: Table name
+            filter: PocketBase-style filter
+            sort: PocketBase-style sort
+            page: Page number (1-indexed)
+            per_page: Records per page
+            with_total: Add the _TOTAL_COLUMN window count to every row
 
-class SQLiteInterfaceClient:
+        Returns:
+            SQL query string
+        """
+        columns = f"*, {_TOTAL_SELECT}" if with_total else "*"
+        query = self._build_select_query(
+            collection, filter=filter, sort=sort, columns=columns
+        )
+        offset = (page - 1) * per_page
+        return f"{query} LIMIT {per_page} OFFSET {offset}"
+
+    def _build_count_query(self, collection: str, filter: str | None) -> str:
+        """Build a COUNT(*) query matching _build_page_query's WHERE clause."""
+        query = f"SELECT COUNT(*) as total FROM {_validate_table(collection)}"
+        if filter:
+            sql_where = self._convert_filter_to_sql(filter)
+            if sql_where:
+                query += f" WHERE {sql_where}"
+        return query
+
+
+class SQLiteInterfaceClient(_SQLQueryBuilder):
     """
     Direct SQL interface client for SQLite database.
 
@@ -38,9 +341,46 @@ class SQLiteInterfaceClient:
         self.base_url = settings.sql_interface_url.rstrip("/") if settings.sql_interface_url else None
         self.timeout = 30  # SQL queries may take longer
         self.token: str | None = None
+        self._client: httpx.Client | None = None
+        self._resp_cache: TTLCache = TTLCache(
+            maxsize=RESPONSE_CACHE_MAX_ROWS,
+            ttl=RESPONSE_CACHE_TTL_SECONDS,
+            getsizeof=len,
+        )
+        self._resp_cache_lock = threading.Lock()
+        # Circuit breaker state, shared by every thread using this client
+        self._fail_count = 0
+        self._first_fail_at = 0.0
+        self._breaker_reset_at = 0.0
+        self._breaker_lock = threading.Lock()
 
         if not self.base_url:
             logger.warning("SQL_INTERFACE_URL not configured")
+            return
+
+        # Persistent client so paginated queries reuse warm keep-alive sockets
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            **_http_version_options(),
+            headers={"Accept": "application/json"},
+        )
+
+    def close(self) -> None:
+        """Close the persistent HTTP client."""
+        if self._client is not None:
+            self._client.close()
+
+    def __enter__(self) -> "SQLiteInterfaceClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def auth_admin(self) -> None:
         """
@@ -55,12 +395,18 @@ class SQLiteInterfaceClient:
         # Future: Extract JWT token from request context and store
         self.token = None
 
-    def execute_raw_sql(self, query: str) -> List[Dict]:
+    def execute_raw_sql(self, query: str, *, cache: bool = False) -> List[Dict]:
         """
         Execute raw SQL query via API endpoint.
 
+        With cache=True, identical query text within RESPONSE_CACHE_TTL_SECONDS
+        is served from an in-memory cache. Callers get their own copies of the
+        rows.
+
         Args:
             query: SQL query to execute
+            cache: Serve from and fill the response cache; results with more
+                than RESPONSE_CACHE_MAX_ROWS rows are never cached
 
         Returns:
             List of records as dictionaries
@@ -68,31 +414,49 @@ class SQLiteInterfaceClient:
         Raises:
             Exception: If query execution fails
         """
-        if not self.base_url:
+        if not cache:
+            return self._execute_uncached(query)
+
+        with self._resp_cache_lock:
+            cached = self._resp_cache.get(query)
+        if cached is not None:
+            logger.debug(f"SQL cache hit: {query[:100]}...")
+            return [dict(row) for row in cached]
+
+        rows = self._execute_uncached(query)
+        if len(rows) <= RESPONSE_CACHE_MAX_ROWS:
+            with self._resp_cache_lock:
+                self._resp_cache[query] = [dict(row) for row in rows]
+        return rows
+
+    def invalidate(self, collection: str | None = None) -> None:
+        """
+        Drop cached query results.
+
+        Args:
+            collection: Only drop queries that mention this table; all
+                cached results are dropped when omitted
+        """
+        with self._resp_cache_lock:
+            if collection is None:
+                self._resp_cache.clear()
+                return
+
+            pattern = re.compile(rf"\b{re.escape(collection)}\b")
+            for query in [q for q in self._resp_cache if pattern.search(q)]:
+                self._resp_cache.pop(query, None)
+
+    def _execute_uncached(self, query: str) -> List[Dict]:
+        """Send a query to the SQL interface and parse the row list."""
+        if not self._client:
             raise ValueError("SQL_INTERFACE_URL not configured in settings")
 
         try:
-            # URL encode the query
-            encoded_query = urllib.parse.quote(query)
-
-            # Build full URL
-            url = f"{self.base_url}/sqlite-interface/get?query={encoded_query}"
-
             logger.debug(f"SQL Interface: {query[:100]}...")
 
-            # Execute request
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
-
-            response = httpx.get(
-                url,
-                headers=headers,
-                timeout=self.timeout,
-            )
-
+            response = self._send_with_retry(query)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Handle response format
             if isinstance(data, list):
@@ -102,17 +466,87 @@ class SQLiteInterfaceClient:
                 logger.warning(f"Unexpected response format: {type(data)}")
                 return []
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"SQL query failed: HTTP {e.response.status_code} - {e.response.text}")
-            raise Exception(f"SQL query failed: {e.response.status_code}")
-
-        except httpx.ConnectError as e:
-            logger.error(f"Cannot connect to SQL interface at {self.base_url}: {e}")
-            raise ConnectionError(f"Cannot connect to SQL interface: {str(e)}")
+        except ConnectionError:
+            raise
 
         except Exception as e:
-            logger.error(f"SQL query error: {str(e)}")
-            raise Exception(f"SQL query execution failed: {str(e)}")
+            raise _map_query_error(e, self.base_url)
+
+    def _send_with_retry(self, query: str) -> httpx.Response:
+        """
+        Send a query, retrying connect errors and 5xx responses.
+
+        Args:
+            query: SQL query string
+
+        Returns:
+            httpx.Response: First non-5xx response, or the last 5xx once
+                retries are exhausted
+
+        Raises:
+            ConnectionError: If the circuit breaker is open
+        """
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            self._check_breaker()
+            try:
+                # httpx encodes the query parameter itself
+                response = self._client.get(
+                    "/sqlite-interface/get",
+                    params={"query": query},
+                    headers=headers,
+                )
+            except _RETRYABLE_ERRORS:
+                self._record_failure()
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+            else:
+                if response.status_code < 500:
+                    self._record_success()
+                    return response
+                self._record_failure()
+                if attempt == RETRY_ATTEMPTS:
+                    return response
+
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                f"⚠️ SQL interface attempt {attempt}/{RETRY_ATTEMPTS} failed, "
+                f"retrying in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+    def _check_breaker(self) -> None:
+        """Fail fast while the circuit breaker is open."""
+        with self._breaker_lock:
+            remaining = self._breaker_reset_at - time.monotonic()
+        if remaining > 0:
+            raise ConnectionError(
+                f"SQL interface circuit open; retry in {remaining:.1f}s"
+            )
+
+    def _record_failure(self) -> None:
+        """Count a failed attempt, opening the breaker past the threshold."""
+        now = time.monotonic()
+        with self._breaker_lock:
+            if now - self._first_fail_at > BREAKER_WINDOW_SECONDS:
+                self._fail_count = 0
+                self._first_fail_at = now
+            self._fail_count += 1
+            if self._fail_count > BREAKER_FAILURE_THRESHOLD:
+                self._breaker_reset_at = now + BREAKER_WINDOW_SECONDS
+                logger.error(
+                    f"❌ SQL interface circuit opened for {BREAKER_WINDOW_SECONDS:.0f}s "
+                    f"after {self._fail_count} consecutive failures"
+                )
+
+    def _record_success(self) -> None:
+        """Close the breaker and clear the failure count."""
+        with self._breaker_lock:
+            self._fail_count = 0
+            self._breaker_reset_at = 0.0
 
     def request(
         self,
@@ -160,7 +594,10 @@ class SQLiteInterfaceClient:
         if len(parts) >= 4 and parts[2] == "records":
             record_id = parts[3]
             # Get single record
-            query = f"SELECT * FROM {collection} WHERE id = '{record_id}' LIMIT 1"
+            query = (
+                f"SELECT * FROM {_validate_table(collection)} "
+                f"WHERE id = {_sql_literal(record_id)} LIMIT 1"
+            )
             results = self.execute_raw_sql(query)
 
             if not results:
@@ -178,11 +615,14 @@ class SQLiteInterfaceClient:
         filter: str | None = None,
         expand: str | None = None,
         sort: str | None = None,
-        per_page: int = 200,
+        per_page: int | None = 200,
     ) -> List[Dict]:
         """
         Get full list of records from collection with automatic pagination.
 
+        Unsorted fetches page by id (keyset) so SQLite never scans past an
+        OFFSET; sorted fetches keep LIMIT/OFFSET.
+
         Mimics PocketBase get_full_list() - fetches ALL records across multiple pages.
 
         Args:
@@ -190,7 +630,8 @@ class SQLiteInterfaceClient:
             filter: PocketBase-style filter (e.g., 'status = "active"')
             expand: Relations to expand (not yet supported)
             sort: Sort field (e.g., "-created" for DESC, "name" for ASC)
-            per_page: Records per page (default: 200)
+            per_page: Records per page (default: 200). None, or a value of at
+                least SINGLE_QUERY_THRESHOLD, fetches everything in one query.
 
         Returns:
             List of ALL records as dictionaries (paginated automatically)
@@ -199,50 +640,20 @@ class SQLiteInterfaceClient:
             Exception: If query fails
         """
         try:
-            all_items = []
-            page = 1
-
-            # Paginate through all results (like PocketBase does)
-            while True:
-                # Build SQL query with pagination
-                query_parts = [f"SELECT * FROM {collection}"]
-
-                # Add WHERE clause if filter provided
-                if filter:
-                    sql_where = self._convert_filter_to_sql(filter)
-                    if sql_where:
-                        query_parts.append(f"WHERE {sql_where}")
-
-                # Add ORDER BY clause if sort provided
-                if sort:
-                    sql_order = self._convert_sort_to_sql(sort)
-                    if sql_order:
-                        query_parts.append(f"ORDER BY {sql_order}")
-
-                # Add pagination (LIMIT/OFFSET)
-                offset = (page - 1) * per_page
-                query_parts.append(f"LIMIT {per_page} OFFSET {offset}")
-
-                # Build final query
-                query = " ".join(query_parts)
-
-                logger.debug(f"SQL query (page {page}): {query}")
-
-                # Execute query
-                results = self.execute_raw_sql(query)
-
-                # Add results to list
-                all_items.extend(results)
-
-                # Check if we got fewer results than per_page (last page)
-                if len(results) < per_page:
-                    break
-
-                page += 1
+            # One unbounded SELECT when the caller does not need batching
+            if per_page is None or per_page >= SINGLE_QUERY_THRESHOLD:
+                all_items = self.execute_raw_sql(
+                    self._build_select_query(collection, filter=filter, sort=sort)
+                )
+                pages = 1
+            elif sort:
+                all_items, pages = self._get_all_pages_offset(collection, filter, sort, per_page)
+            else:
+                all_items, pages = self._get_all_pages_keyset(collection, filter, per_page)
 
             logger.info(
                 f"SQL collection '{collection}': retrieved {len(all_items)} records "
-                f"across {page} page(s)"
+                f"across {pages} page(s)"
             )
             return all_items
 
@@ -250,6 +661,56 @@ class SQLiteInterfaceClient:
             logger.error(f"Failed to get records from '{collection}': {e}")
             raise
 
+    def _get_all_pages_keyset(
+        self, collection: str, filter: str | None, per_page: int
+    ) -> tuple[List[Dict], int]:
+        """
+        Fetch all rows in id order, resuming each page after the last seen id.
+
+        Returns:
+            Tuple of (all records, number of pages fetched)
+        """
+        all_items: List[Dict] = []
+        last_id = None
+        page = 0
+
+        while True:
+            page += 1
+            query = self._build_keyset_query(collection, filter, last_id, per_page)
+            logger.debug(f"SQL keyset query (page {page}): {query}")
+
+            results = self.execute_raw_sql(query)
+            all_items.extend(results)
+
+            if len(results) < per_page:
+                return all_items, page
+            last_id = results[-1]["id"]
+
+    def _get_all_pages_offset(
+        self, collection: str, filter: str | None, sort: str, per_page: int
+    ) -> tuple[List[Dict], int]:
+        """
+        Fetch all rows page by page with LIMIT/OFFSET (used for custom sorts).
+
+        Returns:
+            Tuple of (all records, number of pages fetched)
+        """
+        all_items: List[Dict] = []
+        page = 0
+
+        while True:
+            page += 1
+            query = self._build_page_query(
+                collection, filter=filter, sort=sort, page=page, per_page=per_page
+            )
+            logger.debug(f"SQL query (page {page}): {query}")
+
+            results = self.execute_raw_sql(query)
+            all_items.extend(results)
+
+            if len(results) < per_page:
+                return all_items, page
+
     def get_list(
         self,
         collection: str,
@@ -258,6 +719,7 @@ class SQLiteInterfaceClient:
         per_page: int = 200,
         filter: str | None = None,
         sort: str | None = None,
+        cache: bool = False,
     ) -> Dict:
         """
         Get single page of records from collection.
@@ -270,6 +732,7 @@ class SQLiteInterfaceClient:
             per_page: Records per page (default: 200)
             filter: PocketBase-style filter
             sort: Sort field
+            cache: Serve from the response cache (see execute_raw_sql)
 
         Returns:
             Dict with pagination metadata:
@@ -285,43 +748,30 @@ class SQLiteInterfaceClient:
             Exception: If query fails
         """
         try:
-            # Build base query for counting total
-            count_query_parts = [f"SELECT COUNT(*) as total FROM {collection}"]
-
-            # Add WHERE clause if filter provided
-            if filter:
-                sql_where = self._convert_filter_to_sql(filter)
-                if sql_where:
-                    count_query_parts.append(f"WHERE {sql_where}")
-
-            # Get total count
-            count_query = " ".join(count_query_parts)
-            count_result = self.execute_raw_sql(count_query)
-            total_items = count_result[0]["total"] if count_result else 0
-            total_pages = (total_items + per_page - 1) // per_page  # Ceiling division
-
-            # Build data query with pagination
-            query_parts = [f"SELECT * FROM {collection}"]
-
-            if filter:
-                sql_where = self._convert_filter_to_sql(filter)
-                if sql_where:
-                    query_parts.append(f"WHERE {sql_where}")
-
-            if sort:
-                sql_order = self._convert_sort_to_sql(sort)
-                if sql_order:
-                    query_parts.append(f"ORDER BY {sql_order}")
+            # Page rows and total count in one round trip
+            query = self._build_page_query(
+                collection,
+                filter=filter,
+                sort=sort,
+                page=page,
+                per_page=per_page,
+                with_total=True,
+            )
+            logger.debug(f"SQL paginated query (page {page}): {query}")
 
-            # Add pagination
-            offset = (page - 1) * per_page
-            query_parts.append(f"LIMIT {per_page} OFFSET {offset}")
+            items = self.execute_raw_sql(query, cache=cache)
+            total_items = _pop_total(items)
 
-            # Execute query
-            query = " ".join(query_parts)
-            logger.debug(f"SQL paginated query (page {page}): {query}")
+            # Empty page: only page 1 proves the total is zero
+            if total_items is None:
+                total_items = 0
+                if page > 1:
+                    count_result = self.execute_raw_sql(
+                        self._build_count_query(collection, filter), cache=cache
+                    )
+                    total_items = count_result[0]["total"] if count_result else 0
 
-            items = self.execute_raw_sql(query)
+            total_pages = (total_items + per_page - 1) // per_page  # Ceiling division
 
             logger.info(
                 f"SQL collection '{collection}': page {page}/{total_pages}, "
@@ -341,6 +791,38 @@ class SQLiteInterfaceClient:
             logger.error(f"Failed to get paginated records from '{collection}': {e}")
             raise
 
+    def get_full_list_parallel(
+        self,
+        collection: str,
+        *,
+        filter: str | None = None,
+        sort: str | None = None,
+        per_page: int = 200,
+    ) -> List[Dict]:
+        """
+        Get full list of records, fetching pages concurrently.
+
+        Sync bridge to AsyncSQLiteInterfaceClient.get_full_list(). Runs its own
+        event loop, so it must not be called from inside a running loop.
+
+        Args:
+            collection: Table name
+            filter: PocketBase-style filter
+            sort: Sort field
+            per_page: Records per page (default: 200)
+
+        Returns:
+            List of ALL records, in page order
+        """
+
+        async def _run() -> List[Dict]:
+            async with AsyncSQLiteInterfaceClient(self.base_url, token=self.token) as client:
+                return await client.get_full_list(
+                    collection, filter=filter, sort=sort, per_page=per_page
+                )
+
+        return asyncio.run(_run())
+
     def get_grouped_list(
         self,
         collection: str,
@@ -352,6 +834,7 @@ class SQLiteInterfaceClient:
         is_full_list: bool = True,
         page: int = 1,
         per_page: int = 200,
+        cache: bool = False,
     ) -> List[Dict] | Dict:
         """
         Get grouped and aggregated records from collection.
@@ -374,6 +857,7 @@ class SQLiteInterfaceClient:
             is_full_list: If True, returns all records. If False, returns paginated response
             page: Page number (if is_full_list=False)
             per_page: Records per page
+            cache: Serve from the response cache (see execute_raw_sql)
 
         Returns:
             List of dicts (if is_full_list=True) or paginated response dict (if False)
@@ -411,8 +895,12 @@ class SQLiteInterfaceClient:
 
             select_clause = ", ".join(select_fields)
 
+            # Paginated queries also carry the group count via a window function
+            if not is_full_list:
+                select_clause = f"{select_clause}, {_TOTAL_SELECT}"
+
             # Build base query
-            query_parts = [f"SELECT {select_clause} FROM {collection}"]
+            query_parts = [f"SELECT {select_clause} FROM {_validate_table(collection)}"]
 
             # Add WHERE clause
             if filter:
@@ -436,7 +924,7 @@ class SQLiteInterfaceClient:
                 query = " ".join(query_parts)
                 logger.debug(f"SQL grouped query (full list): {query}")
 
-                results = self.execute_raw_sql(query)
+                results = self.execute_raw_sql(query, cache=cache)
 
                 logger.info(
                     f"SQL grouped query on '{collection}': "
@@ -447,24 +935,26 @@ class SQLiteInterfaceClient:
             else:
                 # Paginated response
 
-                # First, get total count of groups
-                count_query_parts = [f"SELECT COUNT(*) as total FROM ("]
-                count_query_parts.append(" ".join(query_parts))
-                count_query_parts.append(")")
-
-                count_query = " ".join(count_query_parts)
-                count_result = self.execute_raw_sql(count_query)
-                total_items = count_result[0]["total"] if count_result else 0
-                total_pages = (total_items + per_page - 1) // per_page
-
-                # Add pagination to data query
+                # Window COUNT(*) OVER () runs after GROUP BY, so it counts groups
+                group_query = " ".join(query_parts)
                 offset = (page - 1) * per_page
-                query_parts.append(f"LIMIT {per_page} OFFSET {offset}")
-
-                query = " ".join(query_parts)
+                query = f"{group_query} LIMIT {per_page} OFFSET {offset}"
                 logger.debug(f"SQL grouped query (page {page}): {query}")
 
-                items = self.execute_raw_sql(query)
+                items = self.execute_raw_sql(query, cache=cache)
+                total_items = _pop_total(items)
+
+                # Empty page past the end: fall back to counting the groups
+                if total_items is None:
+                    total_items = 0
+                    if page > 1:
+                        count_result = self.execute_raw_sql(
+                            f"SELECT COUNT(*) as total FROM ({group_query})",
+                            cache=cache,
+                        )
+                        total_items = count_result[0]["total"] if count_result else 0
+
+                total_pages = (total_items + per_page - 1) // per_page
 
                 logger.info(
                     f"SQL grouped query on '{collection}': "
@@ -484,71 +974,195 @@ class SQLiteInterfaceClient:
             logger.error(f"Failed to execute grouped query on '{collection}': {e}")
             raise
 
-    def _convert_filter_to_sql(self, pb_filter: str) -> str:
+
+class AsyncSQLiteInterfaceClient(_SQLQueryBuilder):
+    """
+    Async SQL interface client for concurrent page fetches.
+
+    Pages are independent SELECTs, so once page 1 reveals totalPages the
+    rest are requested together with at most MAX_CONCURRENT_QUERIES in flight.
+    """
+
+    def __init__(self, base_url: str | None = None, *, token: str | None = None):
         """
-        Convert PocketBase filter syntax to SQL WHERE clause.
+        Initialize async SQL interface client.
 
         Args:
-            pb_filter: PocketBase filter (e.g., 'status = "active" && priority > 5')
+            base_url: SQL interface URL (defaults to settings.sql_interface_url)
+            token: Optional bearer token
+        """
+        base_url = base_url or settings.sql_interface_url
+        if not base_url:
+            raise ValueError("SQL_INTERFACE_URL not configured in settings")
 
-        Returns:
-            SQL WHERE clause (e.g., "status = 'active' AND priority > 5")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = 30
+        self.token = token
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=32),
+            **_http_version_options(),
+            headers={"Accept": "application/json"},
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncSQLiteInterfaceClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def execute_raw_sql(self, query: str) -> List[Dict]:
         """
-        if not pb_filter:
-            return ""
+        Execute raw SQL query via API endpoint.
 
-        try:
-            # Simple conversions
-            sql_filter = pb_filter
+        Args:
+            query: SQL query to execute
 
-            # Replace PocketBase operators with SQL operators
-            sql_filter = sql_filter.replace("&&", "AND")
-            sql_filter = sql_filter.replace("||", "OR")
-            sql_filter = sql_filter.replace("!=", "<>")
+        Returns:
+            List of records as dictionaries
 
-            # Handle relation field syntax: "jobId.workOrderNumber" → "workOrderNumber"
-            # This assumes the relation is already expanded or denormalized
-            # TODO: Handle complex joins if needed
-            if "." in sql_filter:
-                logger.debug(f"Filter contains relation syntax (.), may need adjustment: {sql_filter}")
+        Raises:
+            ConnectionError: If the SQL interface is unreachable
+            Exception: If query execution fails
+        """
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
 
-            return sql_filter
+        try:
+            async with self._semaphore:
+                response = await self._client.get(
+                    "/sqlite-interface/get",
+                    params={"query": query},
+                    headers=headers,
+                )
+
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            return data if isinstance(data, list) else []
 
         except Exception as e:
-            logger.error(f"Error converting filter to SQL: {e}")
-            return ""
+            raise _map_query_error(e, self.base_url)
 
-    def _convert_sort_to_sql(self, pb_sort: str) -> str:
+    async def get_list(
+        self,
+        collection: str,
+        *,
+        page: int = 1,
+        per_page: int = 200,
+        filter: str | None = None,
+        sort: str | None = None,
+    ) -> Dict:
         """
-        Convert PocketBase sort syntax to SQL ORDER BY clause.
+        Get single page of records with pagination metadata.
+
+        The total count rides along on the page rows via a window function.
 
         Args:
-            pb_sort: PocketBase sort (e.g., "-created" for DESC, "name,id" for multiple)
+            collection: Table name
+            page: Page number (1-indexed)
+            per_page: Records per page
+            filter: PocketBase-style filter
+            sort: Sort field
 
         Returns:
-            SQL ORDER BY clause (e.g., "created DESC", "name ASC, id ASC")
+            Dict in PocketBase get_list() format
         """
-        if not pb_sort:
-            return ""
+        items = await self.execute_raw_sql(
+            self._build_page_query(
+                collection,
+                filter=filter,
+                sort=sort,
+                page=page,
+                per_page=per_page,
+                with_total=True,
+            )
+        )
+        total_items = _pop_total(items)
+
+        # Empty page: only page 1 proves the total is zero
+        if total_items is None:
+            total_items = 0
+            if page > 1:
+                count_result = await self.execute_raw_sql(
+                    self._build_count_query(collection, filter)
+                )
+                total_items = count_result[0]["total"] if count_result else 0
 
-        try:
-            # Split multiple sort fields
-            sort_fields = [s.strip() for s in pb_sort.split(",")]
-            sql_parts = []
+        return {
+            "page": page,
+            "perPage": per_page,
+            "totalItems": total_items,
+            "totalPages": (total_items + per_page - 1) // per_page,
+            "items": items,
+        }
 
-            for field in sort_fields:
-                if field.startswith("-"):
-                    # Descending order
-                    sql_parts.append(f"{field[1:]} DESC")
-                else:
-                    # Ascending order (default)
-                    sql_parts.append(f"{field} ASC")
+    async def get_full_list(
+        self,
+        collection: str,
+        *,
+        filter: str | None = None,
+        sort: str | None = None,
+        per_page: int = 200,
+    ) -> List[Dict]:
+        """
+        Get all records of a collection, fetching pages concurrently.
 
-            return ", ".join(sql_parts)
+        Pages are ordered by sort with id as the tiebreaker (by id alone when
+        unsorted), so independent OFFSET queries partition the rows exactly.
 
-        except Exception as e:
-            logger.error(f"Error converting sort to SQL: {e}")
-            return ""
+        Args:
+            collection: Table name
+            filter: PocketBase-style filter
+            sort: Sort field
+            per_page: Records per page
+
+        Returns:
+            List of ALL records, in page order
+        """
+        sort = _stable_sort(sort)
+        first_page = await self.get_list(
+            collection, page=1, per_page=per_page, filter=filter, sort=sort
+        )
+        total_pages = first_page["totalPages"]
+
+        remaining_pages = await asyncio.gather(
+            *(
+                self._fetch_page(collection, filter, sort, per_page, page)
+                for page in range(2, total_pages + 1)
+            )
+        )
+
+        all_items = list(first_page["items"])
+        for items in remaining_pages:
+            all_items.extend(items)
+
+        logger.info(
+            f"SQL collection '{collection}': retrieved {len(all_items)} records "
+            f"across {max(total_pages, 1)} page(s) (parallel)"
+        )
+        return all_items
+
+    async def _fetch_page(
+        self,
+        collection: str,
+        filter: str | None,
+        sort: str | None,
+        per_page: int,
+        page: int,
+    ) -> List[Dict]:
+        """Fetch the items of one page."""
+        return await self.execute_raw_sql(
+            self._build_page_query(
+                collection, filter=filter, sort=sort, page=page, per_page=per_page
+            )
+        )
 
 
 # Singleton instance
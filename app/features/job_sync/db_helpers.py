@@ -5,304 +5,575 @@ Helper functions for job queue database operations.
 Each function under 30 lines with single responsibility.
 """
 
+import asyncio
 import hashlib
-import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
+
+import orjson
+import zstandard
+from cachetools import TTLCache
 
 from app.core.logging import get_logger
 from app.features.job_sync.db_schema import get_connection
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# SQLite allows one writer at a time, so writes are serialized on a single
+# thread; WAL lets the reader pool run alongside it
+_db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+_db_reader = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sqlite-reader")
+
+# payload_json holds zstd-compressed JSON BLOBs (legacy rows hold JSON text)
+_zstd_local = threading.local()
+
+# {erp_id: (payload_hash, id)} for rows this process stored or confirmed,
+# so unchanged records skip the find_by_hashes query. The TTL bounds
+# drift if the database is changed by another process.
+_STORED_HASH_CACHE_TTL_SECONDS = 3600
+_STORED_HASH_CACHE: TTLCache = TTLCache(
+    maxsize=200_000, ttl=_STORED_HASH_CACHE_TTL_SECONDS
+)
+_STORED_HASH_LOCK = threading.Lock()
+
+# SQL is kept in module constants so the connection's statement cache
+# always sees byte-identical text
+REQUEUE_JOB_SQL = """
+    UPDATE job_queue
+    SET status = 'queued', updated_at = ?,
+        next_attempt_at = ?, retry_count = 0
+    WHERE id = ?
+"""
+
+INSERT_JOB_SQL = """
+    INSERT INTO job_queue
+    (payload_ref, status, created_at, updated_at, next_attempt_at)
+    VALUES (?, 'queued', ?, ?, ?)
+"""
+
+# Padded like FIND_BY_HASHES_SQL below
+JOB_LOOKUP_CHUNK_SIZE = 500
+
+SELECT_JOBS_BY_PAYLOADS_SQL = f"""
+    SELECT payload_ref, id, status FROM job_queue
+    WHERE payload_ref IN ({", ".join("?" * JOB_LOOKUP_CHUNK_SIZE)})
+"""
+
+MARK_JOB_DONE_SQL = """
+    UPDATE job_queue
+    SET status = 'done', updated_at = ?
+    WHERE id = ?
+"""
+
+SELECT_RETRY_COUNT_SQL = "SELECT retry_count FROM job_queue WHERE id = ?"
+
+MARK_JOB_FAILED_SQL = """
+    UPDATE job_queue
+    SET status = ?, retry_count = ?, last_error = ?,
+        next_attempt_at = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+SET_PB_RECORD_ID_SQL = "UPDATE erp_raw_data SET pb_record_id = ? WHERE id = ?"
+
+INSERT_PUSH_LOG_SQL = """
+    INSERT INTO push_log (job_id, response_code, response_body, sent_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+RESET_STUCK_JOBS_SQL = """
+    UPDATE job_queue
+    SET status = 'queued', updated_at = ?
+    WHERE status = 'processing'
+    AND last_attempt_at < ?
+"""
+
+COUNT_ERP_ROWS_SQL = "SELECT COUNT(*) FROM erp_raw_data"
+
+COUNT_JOBS_BY_STATUS_SQL = """
+    SELECT status, COUNT(*) as count
+    FROM job_queue
+    GROUP BY status
+"""
+
+MAX_FETCHED_AT_SQL = "SELECT MAX(fetched_at) FROM erp_raw_data"
+
+CHECKPOINT_WAL_SQL = "PRAGMA wal_checkpoint(TRUNCATE)"
+
+# Bulk ingestion: batches are staged in a per-connection TEMP table and
+# only new or changed rows are written to erp_raw_data
+CREATE_INCOMING_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS _incoming (
+        erp_id TEXT PRIMARY KEY,
+        new_hash TEXT NOT NULL,
+        payload BLOB NOT NULL
+    )
+"""
+
+CLEAR_INCOMING_SQL = "DELETE FROM _incoming"
+
+INSERT_INCOMING_SQL = "INSERT OR REPLACE INTO _incoming VALUES (?, ?, ?)"
+
+SELECT_INCOMING_EXISTING_SQL = """
+    SELECT i.erp_id, e.id, e.payload_hash
+    FROM _incoming i
+    JOIN erp_raw_data e ON e.erp_id = i.erp_id
+"""
+
+# Hash lookups always bind exactly this many values (short chunks are padded)
+# so every chunk reuses one cached statement; well under SQLite's 999 limit
+HASH_LOOKUP_CHUNK_SIZE = 500
+
+FIND_BY_HASHES_SQL = f"""
+    SELECT payload_hash, id, erp_id FROM erp_raw_data
+    WHERE payload_hash IN ({", ".join("?" * HASH_LOOKUP_CHUNK_SIZE)})
+"""
+
+UPSERT_INCOMING_SQL = """
+    INSERT INTO erp_raw_data (erp_id, payload_json, payload_hash, fetched_at)
+    SELECT i.erp_id, i.payload, i.new_hash, ?
+    FROM _incoming i
+    LEFT JOIN erp_raw_data e ON e.erp_id = i.erp_id
+    WHERE e.id IS NULL OR e.payload_hash <> i.new_hash
+    ON CONFLICT(erp_id) DO UPDATE SET
+        payload_json = excluded.payload_json,
+        payload_hash = excluded.payload_hash,
+        fetched_at = excluded.fetched_at
+    RETURNING id, erp_id
+"""
+
+
+def _cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """
+    Open a cursor that yields plain tuples.
+
+    The connection default is sqlite3.Row; these helpers only index rows
+    by position, so they skip the per-row Row allocation.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
 
 def now_utc() -> str:
     """Get current UTC time as ISO string."""
     return datetime.now(timezone.utc).isoformat()
 
 
-def calculate_payload_hash(payload: dict) -> str:
+def serialize_payload(payload: dict | bytes) -> bytes:
+    """
+    Serialize payload to canonical (key-sorted) JSON bytes.
+
+    Bytes are taken as already-serialized JSON and returned unchanged, so
+    callers holding raw upstream bytes skip the dict round trip. They must
+    pass the same form on every sync for hashes to stay comparable.
+    """
+    if isinstance(payload, bytes):
+        return payload
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+def hash_payload_bytes(payload_bytes: bytes) -> str:
+    """Hash already-serialized payload bytes."""
+    return hashlib.blake2b(payload_bytes, digest_size=16).hexdigest()
+
+
+def _zstd() -> tuple[zstandard.ZstdCompressor, zstandard.ZstdDecompressor]:
+    """Get this thread's zstd (de)compressor; instances are not thread-safe."""
+    codecs = getattr(_zstd_local, "codecs", None)
+    if codecs is None:
+        codecs = (zstandard.ZstdCompressor(level=3), zstandard.ZstdDecompressor())
+        _zstd_local.codecs = codecs
+    return codecs
+
+
+def compress_payload(payload_bytes: bytes) -> bytes:
+    """Compress serialized payload bytes for storage in payload_json."""
+    return _zstd()[0].compress(payload_bytes)
+
+
+def load_stored_payload(stored: bytes | str) -> dict:
+    """
+    Decode a payload_json value.
+
+    Args:
+        stored: zstd-compressed BLOB, or JSON text from rows written
+            before compression was introduced
+
+    Returns:
+        Payload dict
+    """
+    if isinstance(stored, bytes):
+        stored = _zstd()[1].decompress(stored)
+    return orjson.loads(stored)
+
+
+def calculate_payload_hash(payload: dict | bytes) -> str:
     """
     Calculate hash of payload for change detection.
 
     Args:
-        payload: Data dictionary
+        payload: Data dictionary or already-serialized JSON bytes
 
     Returns:
-        MD5 hash string
+        BLAKE2b-128 hex digest (32 chars, same width as the old MD5 hash)
     """
-    payload_json = json.dumps(payload, sort_keys=True)
-    return hashlib.md5(payload_json.encode()).hexdigest()
+    return hash_payload_bytes(serialize_payload(payload))
+
+
+# Take the write lock up front so a batch never fails upgrading a read lock
+BEGIN_IMMEDIATE_SQL = "BEGIN IMMEDIATE"
+
+# Claims up to N of the oldest due jobs; needs SQLite >= 3.35 for RETURNING
+CLAIM_JOBS_SQL = """
+    UPDATE job_queue
+    SET status = 'processing', last_attempt_at = ?, updated_at = ?
+    WHERE id IN (
+        SELECT id FROM job_queue
+        WHERE status = 'queued' AND next_attempt_at <= ?
+        ORDER BY created_at ASC
+        LIMIT ?
+    )
+    RETURNING id, payload_ref,
+        (SELECT payload_json FROM erp_raw_data WHERE id = job_queue.payload_ref),
+        (SELECT pb_record_id FROM erp_raw_data WHERE id = job_queue.payload_ref)
+"""
 
 
-def insert_raw_erp_data(erp_id: str, payload: dict) -> tuple[int, bool] | tuple[None, bool]:
+def _stage_incoming(
+    cursor: sqlite3.Cursor, rows: list[tuple[str, str, bytes]]
+) -> None:
+    """
+    Load a batch into the connection's TEMP _incoming table.
+
+    Args:
+        cursor: Cursor inside the caller's transaction
+        rows: List of (erp_id, new_hash, payload_blob); later duplicates win
+    """
+    cursor.execute(CREATE_INCOMING_SQL)
+    cursor.execute(CLEAR_INCOMING_SQL)
+    cursor.executemany(INSERT_INCOMING_SQL, rows)
+
+
+def insert_raw_erp_data_bulk(
+    records: list[tuple[str, dict | bytes]]
+) -> list[tuple[int, bool] | tuple[None, bool]]:
     """
-    Insert or update raw ERP data using hash comparison.
+    Insert or update many raw ERP records in one transaction.
+
+    The batch is staged in a TEMP table and diffed against erp_raw_data
+    with joins, so change detection runs inside SQLite.
 
     Args:
-        erp_id: Unique ERP identifier
-        payload: Raw ERP data
+        records: List of (erp_id, payload) tuples; payloads may be dicts
+            or already-serialized JSON bytes
 
     Returns:
-        Tuple of (record_id, is_updated)
+        List of (record_id, is_updated) tuples, in input order
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        new_hash = calculate_payload_hash(payload)
-        new_payload_json = json.dumps(payload, sort_keys=True)
-
-        cursor.execute(
-            "SELECT id, payload_hash FROM erp_raw_data WHERE erp_id = ?",
-            (erp_id,),
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            record_id = existing[0]
-            old_hash = existing[1]
-
-            is_updated = old_hash != new_hash
-
-            if is_updated:
-                cursor.execute(
-                    """
-                    UPDATE erp_raw_data
-                    SET payload_json = ?, payload_hash = ?, fetched_at = ?
-                    WHERE id = ?
-                    """,
-                    (new_payload_json, new_hash, now_utc(), record_id),
-                )
-                conn.commit()
-                logger.info(f"🔄 Updated record {erp_id} (hash changed)")
-
-            conn.close()
-            return record_id, is_updated
-        else:
-            cursor.execute(
-                """
-                INSERT INTO erp_raw_data
-                (erp_id, payload_json, payload_hash, fetched_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (erp_id, new_payload_json, new_hash, now_utc()),
-            )
-            record_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            return record_id, False
+        hashed = []
+        for erp_id, payload in records:
+            payload_bytes = serialize_payload(payload)
+            hashed.append((erp_id, hash_payload_bytes(payload_bytes), payload_bytes))
+
+        # Rows already stored with the same payload skip compression and staging
+        latest = {erp_id: payload_hash for erp_id, payload_hash, _ in hashed}
+        unchanged = _find_unchanged(latest)
+        rows = [
+            (erp_id, payload_hash, compress_payload(payload_bytes))
+            for erp_id, payload_hash, payload_bytes in hashed
+            if erp_id not in unchanged
+        ]
+        before, written = _upsert_staged(rows) if rows else ({}, {})
+        _remember_stored(latest, unchanged, written)
+
+        results = []
+        for erp_id, new_hash, _ in hashed:
+            if erp_id in unchanged:
+                results.append((unchanged[erp_id], False))
+            elif erp_id in before:
+                record_id, old_hash = before[erp_id]
+                results.append((record_id, old_hash != new_hash))
+            else:
+                results.append((written.get(erp_id), False))
+        return results
 
     except Exception as e:
-        logger.error(f"❌ Error inserting raw data: {str(e)}")
-        return None, False
+        logger.error(f"❌ Error bulk inserting raw data: {str(e)}")
+        return [(None, False)] * len(records)
 
 
-def create_job_for_payload(
-    payload_ref: int, force_requeue: bool = False
-) -> int | None:
+def _find_unchanged(latest: dict[str, str]) -> dict[str, int]:
     """
-    Create a job queue entry or requeue if done.
+    Find records already stored with the same payload hash.
 
     Args:
-        payload_ref: Reference to erp_raw_data.id
-        force_requeue: Reset done jobs to queued
+        latest: {erp_id: payload_hash} for the batch
 
     Returns:
-        Job ID if created, None on error
+        Dict mapping each unchanged erp_id to its row id
     """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT id, status FROM job_queue WHERE payload_ref = ?",
-            (payload_ref,),
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            job_id, status = existing[0], existing[1]
-
-            if force_requeue and status == "done":
-                now = now_utc()
-                cursor.execute(
-                    """
-                    UPDATE job_queue
-                    SET status = 'queued', updated_at = ?,
-                        next_attempt_at = ?, retry_count = 0
-                    WHERE id = ?
-                    """,
-                    (now, now, job_id),
-                )
-                conn.commit()
-                logger.info(f"🔄 Requeued job {job_id} for updated data")
-
-            conn.close()
-            return job_id
-
-        now = now_utc()
-        cursor.execute(
-            """
-            INSERT INTO job_queue
-            (payload_ref, status, created_at, updated_at, next_attempt_at)
-            VALUES (?, 'queued', ?, ?, ?)
-            """,
-            (payload_ref, now, now, now),
-        )
-        job_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return job_id
+    unchanged: dict[str, int] = {}
+    with _STORED_HASH_LOCK:
+        for erp_id, payload_hash in latest.items():
+            cached = _STORED_HASH_CACHE.get(erp_id)
+            if cached is not None and cached[0] == payload_hash:
+                unchanged[erp_id] = cached[1]
+
+    unknown = [h for erp_id, h in latest.items() if erp_id not in unchanged]
+    stored = find_by_hashes(unknown) if unknown else {}
+    for erp_id, payload_hash in latest.items():
+        if stored.get(payload_hash, (None, None))[1] == erp_id:
+            unchanged[erp_id] = stored[payload_hash][0]
+    return unchanged
+
+
+def _remember_stored(
+    latest: dict[str, str], unchanged: dict[str, int], written: dict[str, int]
+) -> None:
+    """Cache the hash and row id of every record now known to be stored."""
+    with _STORED_HASH_LOCK:
+        for erp_id, record_id in (*unchanged.items(), *written.items()):
+            _STORED_HASH_CACHE[erp_id] = (latest[erp_id], record_id)
 
-    except Exception as e:
-        logger.error(f"❌ Error creating job: {str(e)}")
-        return None
 
+def _upsert_staged(
+    rows: list[tuple[str, str, bytes]]
+) -> tuple[dict[str, tuple[int, str]], dict[str, int]]:
+    """
+    Stage rows and upsert the new or changed ones in one transaction.
+
+    Args:
+        rows: List of (erp_id, new_hash, payload_blob)
+
+    Returns:
+        Tuple of ({erp_id: (id, old_hash)} for rows that existed before,
+        {erp_id: id} for rows written)
+    """
+    with get_connection() as conn:
+        cursor = _cursor(conn)
+        cursor.execute(BEGIN_IMMEDIATE_SQL)
+        _stage_incoming(cursor, rows)
+        cursor.execute(SELECT_INCOMING_EXISTING_SQL)
+        before = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+        cursor.execute(UPSERT_INCOMING_SQL, (now_utc(),))
+        written = {erp_id: record_id for record_id, erp_id in cursor.fetchall()}
+        cursor.execute(CLEAR_INCOMING_SQL)
+    return before, written
+
+
+def find_by_hashes(hashes: list[str]) -> dict[str, tuple[int, str]]:
+    """
+    Look up stored rows by payload hash via idx_payload_hash.
+
+    Args:
+        hashes: Payload hashes (duplicates are fine)
+
+    Returns:
+        Dict mapping each stored hash to its (id, erp_id)
+    """
+    found: dict[str, tuple[int, str]] = {}
+    unique = list(dict.fromkeys(hashes))
+
+    with get_connection() as conn:
+        cursor = _cursor(conn)
+        for start in range(0, len(unique), HASH_LOOKUP_CHUNK_SIZE):
+            chunk = unique[start:start + HASH_LOOKUP_CHUNK_SIZE]
+            chunk += [chunk[-1]] * (HASH_LOOKUP_CHUNK_SIZE - len(chunk))
+            cursor.execute(FIND_BY_HASHES_SQL, chunk)
+            for payload_hash, record_id, erp_id in cursor.fetchall():
+                found[payload_hash] = (record_id, erp_id)
+
+    return found
 
-def get_next_queued_job() -> dict[str, Any] | None:
+
+def create_jobs_bulk(payloads: list[tuple[int, bool]]) -> int:
     """
-    Get next queued job and mark as processing.
+    Create or requeue jobs for many payloads in one transaction.
+
+    Args:
+        payloads: List of (payload_ref, force_requeue) tuples
 
     Returns:
-        Job dict with payload, or None if no jobs
+        Number of jobs created or requeued, 0 on error
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT j.id, j.payload_ref, e.payload_json
-            FROM job_queue j
-            JOIN erp_raw_data e ON j.payload_ref = e.id
-            WHERE j.status = 'queued'
-            AND j.next_attempt_at <= ?
-            ORDER BY j.created_at ASC
-            LIMIT 1
-            """,
-            (now_utc(),),
-        )
-        row = cursor.fetchone()
-
-        if not row:
-            conn.close()
-            return None
-
-        job_id, payload_ref, payload_json = row
-
-        cursor.execute(
-            """
-            UPDATE job_queue
-            SET status = 'processing', last_attempt_at = ?, updated_at = ?
-            WHERE id = ?
-            """,
-            (now_utc(), now_utc(), job_id),
-        )
-        conn.commit()
-        conn.close()
-
-        return {
-            "id": job_id,
-            "payload_ref": payload_ref,
-            "payload": json.loads(payload_json),
-        }
+        with get_connection() as conn:
+            cursor = _cursor(conn)
+            cursor.execute(BEGIN_IMMEDIATE_SQL)
+            existing = _jobs_by_payload(cursor, [ref for ref, _ in payloads])
+
+            now = now_utc()
+            new_refs = dict.fromkeys(ref for ref, _ in payloads if ref not in existing)
+            requeue_ids = {
+                existing[ref][0]
+                for ref, force_requeue in payloads
+                if force_requeue and ref in existing and existing[ref][1] == "done"
+            }
+            cursor.executemany(
+                INSERT_JOB_SQL, [(ref, now, now, now) for ref in new_refs]
+            )
+            cursor.executemany(
+                REQUEUE_JOB_SQL, [(now, now, job_id) for job_id in requeue_ids]
+            )
+
+        if requeue_ids:
+            logger.info(f"🔄 Requeued {len(requeue_ids)} jobs for updated data")
+        return len(new_refs) + len(requeue_ids)
 
     except Exception as e:
-        logger.error(f"❌ Error getting queued job: {str(e)}")
-        return None
+        logger.error(f"❌ Error creating jobs: {str(e)}")
+        return 0
 
 
-def mark_job_done(job_id: int) -> None:
-    """Mark job as completed."""
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE job_queue
-            SET status = 'done', updated_at = ?
-            WHERE id = ?
-            """,
-            (now_utc(), job_id),
-        )
-        conn.commit()
-        conn.close()
+def _jobs_by_payload(
+    cursor: sqlite3.Cursor, payload_refs: list[int]
+) -> dict[int, tuple[int, str]]:
+    """
+    Look up existing jobs by payload_ref via idx_jq_payload_ref.
 
-    except Exception as e:
-        logger.error(f"❌ Error marking job done: {str(e)}")
+    Args:
+        cursor: Cursor inside the caller's transaction
+        payload_refs: erp_raw_data ids (duplicates are fine)
+
+    Returns:
+        Dict mapping each payload_ref that has a job to its (job_id, status)
+    """
+    found: dict[int, tuple[int, str]] = {}
+    unique = list(dict.fromkeys(payload_refs))
+
+    for start in range(0, len(unique), JOB_LOOKUP_CHUNK_SIZE):
+        chunk = unique[start:start + JOB_LOOKUP_CHUNK_SIZE]
+        chunk += [chunk[-1]] * (JOB_LOOKUP_CHUNK_SIZE - len(chunk))
+        cursor.execute(SELECT_JOBS_BY_PAYLOADS_SQL, chunk)
+        for payload_ref, job_id, status in cursor.fetchall():
+            found[payload_ref] = (job_id, status)
+
+    return found
 
 
-def mark_job_failed(job_id: int, error_msg: str) -> None:
+def claim_jobs(limit: int) -> list[dict[str, Any]]:
     """
-    Mark job as failed with retry logic.
+    Atomically claim up to limit queued jobs that are due.
 
     Args:
-        job_id: Job ID
-        error_msg: Error message
+        limit: Maximum number of jobs to claim
+
+    Returns:
+        List of job dicts with payload (jobs with a missing payload are skipped)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT retry_count FROM job_queue WHERE id = ?", (job_id,))
-        row = cursor.fetchone()
-
-        if not row:
-            conn.close()
-            return
-
-        retry_count = row[0] + 1
-        max_retries = 5
-        backoff_minutes = min(retry_count * 5, 60)
-
-        if retry_count >= max_retries:
-            status = "failed"
-            next_attempt = None
-        else:
-            status = "queued"
-            next_time = datetime.now(timezone.utc) + timedelta(
-                minutes=backoff_minutes
-            )
-            next_attempt = next_time.isoformat()
-
-        cursor.execute(
-            """
-            UPDATE job_queue
-            SET status = ?, retry_count = ?, last_error = ?,
-                next_attempt_at = ?, updated_at = ?
-            WHERE id = ?
-            """,
-            (status, retry_count, error_msg, next_attempt, now_utc(), job_id),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            now = now_utc()
+            rows = _cursor(conn).execute(
+                CLAIM_JOBS_SQL, (now, now, now, limit)
+            ).fetchall()
+
+        jobs = [_job_from_claim_row(row) for row in rows]
+        return [job for job in jobs if job is not None]
 
     except Exception as e:
-        logger.error(f"❌ Error marking job failed: {str(e)}")
+        logger.error(f"❌ Error claiming queued jobs: {str(e)}")
+        return []
+
 
+def _job_from_claim_row(row: tuple) -> dict[str, Any] | None:
+    """
+    Build a job dict from an (id, payload_ref, payload_json, pb_record_id)
+    claim row.
+    """
+    job_id, payload_ref, payload_json, pb_record_id = row
+    if payload_json is None:
+        logger.error(f"❌ Job {job_id} references missing payload {payload_ref}")
+        return None
+
+    return {
+        "id": job_id,
+        "payload_ref": payload_ref,
+        "payload": load_stored_payload(payload_json),
+        "pb_record_id": pb_record_id,
+    }
+
+
+def _fail_job(
+    cursor: sqlite3.Cursor, job_id: int, error_msg: str, now: datetime
+) -> None:
+    """
+    Requeue a failed job with backoff, or mark it failed after max retries.
 
-def log_push_result(
-    job_id: int, response_code: int, response_body: str
+    Args:
+        cursor: Cursor inside the caller's transaction
+        job_id: Job ID
+        error_msg: Error message
+        now: Current UTC time
+    """
+    cursor.execute(SELECT_RETRY_COUNT_SQL, (job_id,))
+    row = cursor.fetchone()
+
+    if not row:
+        return
+
+    retry_count = row[0] + 1
+    max_retries = 5
+    backoff_minutes = min(retry_count * 5, 60)
+
+    if retry_count >= max_retries:
+        status = "failed"
+        next_attempt = None
+    else:
+        status = "queued"
+        next_time = now + timedelta(minutes=backoff_minutes)
+        next_attempt = next_time.isoformat()
+
+    cursor.execute(
+        MARK_JOB_FAILED_SQL,
+        (status, retry_count, error_msg, next_attempt, now.isoformat(), job_id),
+    )
+
+
+def record_job_results(
+    done_ids: list[int],
+    failures: list[tuple[int, str]],
+    push_logs: list[tuple[int, int, str]],
+    pb_links: list[tuple[str, int]] = (),
 ) -> None:
-    """Log push operation result."""
+    """
+    Write a batch of job outcomes and their push logs in one transaction.
+
+    Args:
+        done_ids: IDs of jobs that succeeded
+        failures: List of (job_id, error_msg) for jobs that failed
+        push_logs: List of (job_id, response_code, response_body) tuples
+        pb_links: List of (pb_record_id, payload_ref) for newly linked rows
+    """
+    if not (done_ids or failures or push_logs or pb_links):
+        return
+
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO push_log (job_id, response_code, response_body, sent_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (job_id, response_code, response_body, now_utc()),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            cursor = _cursor(conn)
+            now = datetime.now(timezone.utc)
+            now_str = now.isoformat()
+
+            cursor.executemany(
+                MARK_JOB_DONE_SQL, [(now_str, job_id) for job_id in done_ids]
+            )
+            for job_id, error_msg in failures:
+                _fail_job(cursor, job_id, error_msg, now)
+            cursor.executemany(
+                INSERT_PUSH_LOG_SQL,
+                [(job_id, code, body, now_str) for job_id, code, body in push_logs],
+            )
+            cursor.executemany(SET_PB_RECORD_ID_SQL, pb_links)
 
     except Exception as e:
-        logger.error(f"❌ Error logging push result: {str(e)}")
+        logger.error(f"❌ Error recording {len(push_logs)} job results: {str(e)}")
 
 
 def reset_stuck_jobs(timeout_minutes: int = 10) -> int:
@@ -316,31 +587,19 @@ def reset_stuck_jobs(timeout_minutes: int = 10) -> int:
         Number of jobs reset
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        timeout = datetime.now(timezone.utc) - timedelta(
-            minutes=timeout_minutes
-        )
-        timeout_str = timeout.isoformat()
-
-        cursor.execute(
-            """
-            UPDATE job_queue
-            SET status = 'queued', updated_at = ?
-            WHERE status = 'processing'
-            AND last_attempt_at < ?
-            """,
-            (now_utc(), timeout_str),
-        )
-        count = cursor.rowcount
-        conn.commit()
-        conn.close()
-
-        if count > 0:
-            logger.warning(f"⚠️  Reset {count} stuck jobs")
-
-        return count
+        with get_connection() as conn:
+            cursor = _cursor(conn)
+
+            now = datetime.now(timezone.utc)
+            timeout_str = (now - timedelta(minutes=timeout_minutes)).isoformat()
+
+            cursor.execute(RESET_STUCK_JOBS_SQL, (now.isoformat(), timeout_str))
+            count = cursor.rowcount
+
+            if count > 0:
+                logger.warning(f"⚠️  Reset {count} stuck jobs")
+
+            return count
 
     except Exception as e:
         logger.error(f"❌ Error resetting stuck jobs: {str(e)}")
@@ -355,42 +614,85 @@ def get_sync_statistics() -> dict[str, Any]:
         Dictionary with sync statistics
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # Total unique records in database
-        cursor.execute("SELECT COUNT(*) FROM erp_raw_data")
-        total_records = cursor.fetchone()[0]
-
-        # Job queue statistics
-        cursor.execute(
-            """
-            SELECT status, COUNT(*) as count
-            FROM job_queue
-            GROUP BY status
-            """
-        )
-        job_status = {row[0]: row[1] for row in cursor.fetchall()}
-
-        # Last fetch timestamp
-        cursor.execute(
-            """
-            SELECT MAX(fetched_at) FROM erp_raw_data
-            """
-        )
-        last_fetch = cursor.fetchone()[0]
-
-        conn.close()
-
-        return {
-            "total_unique_records": total_records,
-            "jobs_queued": job_status.get("queued", 0),
-            "jobs_processing": job_status.get("processing", 0),
-            "jobs_done": job_status.get("done", 0),
-            "jobs_failed": job_status.get("failed", 0),
-            "last_fetch_at": last_fetch,
-        }
+        with get_connection() as conn:
+            cursor = _cursor(conn)
+
+            # Total unique records in database
+            cursor.execute(COUNT_ERP_ROWS_SQL)
+            total_records = cursor.fetchone()[0]
+
+            # Job queue statistics
+            cursor.execute(COUNT_JOBS_BY_STATUS_SQL)
+            job_status = {row[0]: row[1] for row in cursor.fetchall()}
+
+            # Last fetch timestamp
+            cursor.execute(MAX_FETCHED_AT_SQL)
+            last_fetch = cursor.fetchone()[0]
+
+            return {
+                "total_unique_records": total_records,
+                "jobs_queued": job_status.get("queued", 0),
+                "jobs_processing": job_status.get("processing", 0),
+                "jobs_done": job_status.get("done", 0),
+                "jobs_failed": job_status.get("failed", 0),
+                "last_fetch_at": last_fetch,
+            }
 
     except Exception as e:
         logger.error(f"❌ Error getting sync statistics: {str(e)}")
         return {}
+
+
+def checkpoint_wal() -> None:
+    """
+    Checkpoint and truncate the WAL file.
+
+    Called after a large ingest so readers do not have to walk a long WAL.
+    """
+    try:
+        busy, log_pages, checkpointed = get_connection().execute(
+            CHECKPOINT_WAL_SQL
+        ).fetchone()
+        if busy:
+            logger.warning(
+                f"⚠️  WAL checkpoint blocked by readers "
+                f"({checkpointed}/{log_pages} pages)"
+            )
+
+    except Exception as e:
+        logger.error(f"❌ Error checkpointing WAL: {str(e)}")
+
+
+async def _run_write(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking write helper on the single SQLite writer thread."""
+    return await asyncio.get_running_loop().run_in_executor(_db_writer, func, *args)
+
+
+async def _run_read(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking read-only helper on the SQLite reader pool."""
+    return await asyncio.get_running_loop().run_in_executor(_db_reader, func, *args)
+
+
+async def a_claim_jobs(limit: int) -> list[dict[str, Any]]:
+    """Async claim_jobs."""
+    return await _run_write(claim_jobs, limit)
+
+
+async def a_record_job_results(
+    done_ids: list[int],
+    failures: list[tuple[int, str]],
+    push_logs: list[tuple[int, int, str]],
+    pb_links: list[tuple[str, int]] = (),
+) -> None:
+    """Async record_job_results."""
+    await _run_write(record_job_results, done_ids, failures, push_logs, pb_links)
+
+
+async def a_reset_stuck_jobs(timeout_minutes: int = 10) -> int:
+    """Async reset_stuck_jobs."""
+    return await _run_write(reset_stuck_jobs, timeout_minutes)
+
+
+async def a_get_sync_statistics() -> dict[str, Any]:
+    """Async get_sync_statistics."""
+    return await _run_read(get_sync_statistics)
@@ -6,6 +6,7 @@ Following task.md architecture: erp_raw_data, job_queue, push_log.
 """
 
 import sqlite3
+import threading
 from pathlib import Path
 
 from app.core.logging import get_logger
@@ -14,32 +15,91 @@ logger = get_logger(__name__)
 
 DB_PATH = Path("data/job_sync.db")
 
+# Applied once per connection: WAL lets readers run alongside the writer,
+# synchronous=NORMAL drops the per-commit fsync of the rollback journal and
+# busy_timeout waits out a concurrent writer instead of failing with "locked";
+# wal_autocheckpoint checkpoints every 10000 pages (~40MB) during long ingests
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=10000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+_local = threading.local()
+
+# Every connection handed out, so shutdown can close them all; bumping the
+# generation makes threads drop their cached (now closed) connection
+_connections: list[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+_generation = 0
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open and configure a new SQLite connection."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(DB_PATH), check_same_thread=False, cached_statements=256
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 
 def get_connection() -> sqlite3.Connection:
     """
-    Get SQLite database connection.
+    Get this thread's SQLite database connection.
+
+    The connection is opened on first use and reused afterwards, so callers
+    must not close it. Use it as a context manager (``with conn:``) to
+    commit on success and roll back on error.
 
     Returns:
         Database connection
     """
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.generation != _generation:
+        conn = _open_connection()
+        with _connections_lock:
+            _connections.append(conn)
+        _local.conn = conn
+        _local.generation = _generation
     return conn
 
 
+def close_connection() -> None:
+    """Close every connection opened by get_connection (shutdown hook)."""
+    global _generation
+
+    with _connections_lock:
+        _generation += 1
+        connections = _connections[:]
+        _connections.clear()
+
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Failed to close SQLite connection: {e}")
+
+
 def init_database() -> None:
     """Initialize database tables if they don't exist."""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
+
+            create_erp_raw_data_table(cursor)
+            create_job_queue_table(cursor)
+            create_push_log_table(cursor)
 
-        create_erp_raw_data_table(cursor)
-        create_job_queue_table(cursor)
-        create_push_log_table(cursor)
+        # Refresh planner statistics, e.g. for newly created indexes
+        get_connection().execute("PRAGMA optimize")
 
-        conn.commit()
-        conn.close()
         logger.info("✅ Job sync database initialized")
 
     except Exception as e:
@@ -53,15 +113,18 @@ def create_erp_raw_data_table(cursor: sqlite3.Cursor) -> None:
         CREATE TABLE IF NOT EXISTS erp_raw_data (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             erp_id TEXT UNIQUE NOT NULL,
-            payload_json TEXT NOT NULL,
+            payload_json BLOB NOT NULL,
             payload_hash TEXT NOT NULL,
-            fetched_at TEXT NOT NULL
+            fetched_at TEXT NOT NULL,
+            pb_record_id TEXT
         )
     """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_erp_id
-        ON erp_raw_data(erp_id)
-    """)
+    # pb_record_id links a row to its PocketBase record once pushed
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(erp_raw_data)")}
+    if "pb_record_id" not in columns:
+        cursor.execute("ALTER TABLE erp_raw_data ADD COLUMN pb_record_id TEXT")
+    # erp_id is UNIQUE, so SQLite already keeps an index on it
+    cursor.execute("DROP INDEX IF EXISTS idx_erp_id")
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_payload_hash
         ON erp_raw_data(payload_hash)
@@ -84,10 +147,48 @@ def create_job_queue_table(cursor: sqlite3.Cursor) -> None:
             FOREIGN KEY (payload_ref) REFERENCES erp_raw_data(id)
         )
     """)
+    create_job_queue_indexes(cursor)
+
+
+def create_job_queue_indexes(cursor: sqlite3.Cursor) -> None:
+    """
+    Create partial indexes for the job_queue hot queries.
+
+    Partial indexes only hold rows in the matching status, so they stay
+    small while done jobs pile up.
+    """
+    # Superseded by the partial indexes below
+    cursor.execute("DROP INDEX IF EXISTS idx_job_status")
+    cursor.execute("DROP INDEX IF EXISTS idx_jq_status_next")
+
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_job_status
-        ON job_queue(status, next_attempt_at)
+        CREATE INDEX IF NOT EXISTS idx_jq_queued
+        ON job_queue(status, next_attempt_at, created_at)
+        WHERE status = 'queued'
     """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jq_processing
+        ON job_queue(status, last_attempt_at)
+        WHERE status = 'processing'
+    """)
+    # Covers the GROUP BY status counts in get_sync_statistics
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jq_status
+        ON job_queue(status)
+    """)
+
+    try:
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_jq_payload_ref
+            ON job_queue(payload_ref)
+        """)
+    except sqlite3.IntegrityError:
+        # Older databases may hold duplicate jobs per payload
+        logger.warning("⚠️  Duplicate payload_ref in job_queue, using non-unique index")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jq_payload_ref_nonunique
+            ON job_queue(payload_ref)
+        """)
 
 
 def create_push_log_table(cursor: sqlite3.Cursor) -> None:
@@ -5,64 +5,108 @@ Data access layer for ERP API, PocketBase, and SQLite.
 Following spec.md: No business logic, talks to external systems only.
 """
 
-from typing import Any
+import asyncio
+from functools import lru_cache
+from typing import Any, Iterator
 
 import httpx
+import ijson
 
 from app.core.logging import get_logger
 from app.core.settings import settings
 from app.db.client import pb
 from app.features.job_sync import db_helpers
+from app.features.job_sync.schema import ERPRecordDict
 
 logger = get_logger(__name__)
 
+ERP_FETCH_TIMEOUT_SECONDS = 600.0
 
-def fetch_erp_data(from_date: str | None = None) -> list[dict[str, Any]]:
+# Records handed to the store per chunk while streaming the ERP response
+ERP_STREAM_CHUNK_SIZE = 1000
+
+# Persistent ERP API client so repeated syncs reuse the TLS session
+_erp_client = httpx.Client(timeout=ERP_FETCH_TIMEOUT_SECONDS, verify=False)
+
+
+def iter_erp_records(from_date: str | None = None) -> Iterator[list[ERPRecordDict]]:
     """
-    Fetch data from ERP API.
+    Stream ERP records from the API in chunks.
+
+    The response body is parsed incrementally, so the whole payload is never
+    held in memory and each chunk can be stored while the rest downloads.
 
     Args:
-        from_date: Optional date string in YYYY-MM-DD format.
-                   Only added to query if provided.
+        from_date: Optional date string in YYYY-MM-DD format
 
-    Returns:
-        List of ERP records
+    Yields:
+        Lists of up to ERP_STREAM_CHUNK_SIZE ERP records
 
     Raises:
         httpx.HTTPError: On API request failure
     """
+    url = settings.erp_api_url
+    params = _erp_params(from_date)
+    logger.info(f"🔍 Streaming ERP data from {url} with params {params}")
+
+    total = 0
     try:
-        url = settings.erp_api_url
-        params = {}
+        with _erp_client.stream("GET", url, params=params) as response:
+            response.raise_for_status()
+            chunk: list[ERPRecordDict] = []
+            for record in _iter_json_array(response):
+                chunk.append(record)
+                if len(chunk) >= ERP_STREAM_CHUNK_SIZE:
+                    total += len(chunk)
+                    yield chunk
+                    chunk = []
+            if chunk:
+                total += len(chunk)
+                yield chunk
 
-        # Only add txnType if configured in .env
-        if settings.erp_txn_type:
-            params["txnType"] = settings.erp_txn_type
+    except httpx.HTTPError as e:
+        logger.error(f"❌ ERP API request failed after {total} records: {str(e)}")
+        raise
 
-        # Only add fromDate if provided
-        if from_date:
-            params["fromDate"] = from_date
+    logger.info(f"✅ Streamed {total} records from ERP API")
 
-        logger.info(f"🔍 Fetching ERP data from {url} with params {params}")
 
-        response = httpx.get(url, params=params, timeout=600.0, verify=False)
-        response.raise_for_status()
+def _iter_json_array(response: httpx.Response) -> Iterator[ERPRecordDict]:
+    """Incrementally parse the items of a top-level JSON array response."""
+    items = ijson.sendable_list()
+    # Floats instead of Decimal, so payloads serialize and hash as before
+    parser = ijson.items_coro(items, "item", use_float=True)
 
-        data = response.json()
-        logger.info(f"✅ Fetched {len(data)} records from ERP API")
-        return data
+    for data in response.iter_bytes():
+        parser.send(data)
+        yield from items
+        del items[:]
+
+    parser.close()
+    yield from items
 
-    except httpx.TimeoutException as e:
-        logger.error(f"⏱️  ERP API timeout: {str(e)}")
-        raise
-    except httpx.HTTPError as e:
-        logger.error(f"❌ ERP API request failed: {str(e)}")
-        raise
-    except Exception as e:
-        logger.error(f"❌ Unexpected error fetching ERP data: {str(e)}")
-        raise
 
+def _erp_params(from_date: str | None) -> dict[str, str]:
+    """Build the ERP API query parameters."""
+    params = {}
 
+    # Only add txnType if configured in .env
+    if settings.erp_txn_type:
+        params["txnType"] = settings.erp_txn_type
+
+    # Only add fromDate if provided
+    if from_date:
+        params["fromDate"] = from_date
+
+    return params
+
+
+def close() -> None:
+    """Close the persistent ERP API client."""
+    _erp_client.close()
+
+
+@lru_cache(maxsize=1)
 def get_collection_name() -> str:
     """
     Get the PocketBase collection name.
@@ -73,7 +117,41 @@ def get_collection_name() -> str:
     return f"{settings.plant_code}_erpConsolidateData"
 
 
-def create_record(record_data: dict[str, Any]) -> dict[str, Any]:
+# Settings are frozen, so the records endpoint is built once
+_COLLECTION_URL = f"collections/{get_collection_name()}/records"
+
+# Filter template for one ERP key triple; values are bound with pb.filter
+_ERP_KEY_FILTER = (
+    "CUST_ORDER_ID={:cust} && CUST_ORDER_LINE_NO={:line} && BOM_PART_ID={:part}"
+)
+
+# Keys OR-ed into one PocketBase filter (bounded by the filter/URL length)
+BULK_FIND_CHUNK_SIZE = 50
+BULK_FIND_PAGE_SIZE = 500
+
+
+def _key_filter(cust_order_id: str, line_no: Any, part_id: str) -> str:
+    """Build an escaped PocketBase filter for one ERP key triple."""
+    # Line numbers are matched as text, as the field is stored
+    return pb.filter(
+        _ERP_KEY_FILTER,
+        {"cust": cust_order_id, "line": str(line_no), "part": part_id},
+    )
+
+
+def _erp_key_filter(records: list[ERPRecordDict]) -> str:
+    """Build a PocketBase filter matching any of the records' key triples."""
+    return " || ".join(
+        "(" + _key_filter(
+            record["CUST_ORDER_ID"],
+            record["CUST_ORDER_LINE_NO"],
+            record["BOM_PART_ID"],
+        ) + ")"
+        for record in records
+    )
+
+
+async def acreate_record(record_data: dict[str, Any]) -> dict[str, Any]:
     """
     Create a single record in PocketBase.
 
@@ -87,26 +165,16 @@ def create_record(record_data: dict[str, Any]) -> dict[str, Any]:
         httpx.HTTPError: On API request failure
     """
     try:
-        collection = get_collection_name()
-        result = pb.request(
-            "POST",
-            f"collections/{collection}/records",
-            json=record_data,
-        )
-        return result
-
+        return await pb.arequest("POST", _COLLECTION_URL, json=record_data)
     except httpx.HTTPStatusError as e:
         logger.error(
             f"❌ Failed to create record: "
             f"{e.response.status_code} - {e.response.text}"
         )
         raise
-    except Exception as e:
-        logger.error(f"❌ Unexpected error creating record: {str(e)}")
-        raise
 
 
-def update_record(
+async def aupdate_record(
     record_id: str, record_data: dict[str, Any]
 ) -> dict[str, Any]:
     """
@@ -123,26 +191,18 @@ def update_record(
         httpx.HTTPError: On API request failure
     """
     try:
-        collection = get_collection_name()
-        result = pb.request(
-            "PATCH",
-            f"collections/{collection}/records/{record_id}",
-            json=record_data,
+        return await pb.arequest(
+            "PATCH", f"{_COLLECTION_URL}/{record_id}", json=record_data
         )
-        return result
-
     except httpx.HTTPStatusError as e:
         logger.error(
             f"❌ Failed to update record {record_id}: "
             f"{e.response.status_code} - {e.response.text}"
         )
         raise
-    except Exception as e:
-        logger.error(f"❌ Unexpected error updating record {record_id}: {str(e)}")
-        raise
 
 
-def find_existing_record(
+async def afind_existing_record(
     cust_order_id: str, line_no: str, part_id: str
 ) -> dict[str, Any] | None:
     """
@@ -159,56 +219,60 @@ def find_existing_record(
     Raises:
         httpx.HTTPError: On API request failure
     """
-    try:
-        collection = get_collection_name()
-        filter_query = (
-            f'CUST_ORDER_ID="{cust_order_id}" && '
-            f'CUST_ORDER_LINE_NO="{line_no}" && '
-            f'BOM_PART_ID="{part_id}"'
-        )
+    filter_query = _key_filter(cust_order_id, line_no, part_id)
+    response = await pb.arequest(
+        "GET", _COLLECTION_URL, params={"filter": filter_query, "perPage": 1}
+    )
+    items = response.get("items", [])
+    return items[0] if items else None
 
-        response = pb.request(
-            "GET",
-            f"collections/{collection}/records",
-            params={"filter": filter_query, "perPage": 1},
-        )
 
-        items = response.get("items", [])
-        return items[0] if items else None
+async def abulk_find_existing(
+    records: list[ERPRecordDict]
+) -> dict[str, dict[str, Any]]:
+    """
+    Find existing PocketBase records for many ERP records at once.
 
-    except httpx.HTTPStatusError as e:
-        logger.error(
-            f"❌ Failed to find record: "
-            f"{e.response.status_code} - {e.response.text}"
+    Filter chunks are fetched concurrently.
+
+    Args:
+        records: ERP records (CUST_ORDER_ID, CUST_ORDER_LINE_NO, BOM_PART_ID)
+
+    Returns:
+        Dict mapping erp_id (see generate_erp_id) to the PocketBase record
+
+    Raises:
+        httpx.HTTPError: On API request failure
+    """
+    pages = await asyncio.gather(*(
+        pb.get_full_list_async(
+            get_collection_name(),
+            filter=_erp_key_filter(records[start:start + BULK_FIND_CHUNK_SIZE]),
+            per_page=BULK_FIND_PAGE_SIZE,
         )
-        raise
-    except Exception as e:
-        logger.error(f"❌ Unexpected error finding record: {str(e)}")
-        raise
+        for start in range(0, len(records), BULK_FIND_CHUNK_SIZE)
+    ))
+    return {generate_erp_id(item): item for items in pages for item in items}
 
 
-def store_erp_record_in_sqlite(
-    record: dict[str, Any]
-) -> tuple[int, bool] | tuple[None, bool]:
+def store_erp_records_bulk(
+    records: list[ERPRecordDict]
+) -> list[tuple[int, bool] | tuple[None, bool]]:
     """
-    Store ERP record in SQLite database.
+    Store many ERP records in SQLite in a single transaction.
 
     Args:
-        record: ERP record to store
+        records: ERP records to store
 
     Returns:
-        Tuple of (record_id, is_updated)
+        List of (record_id, is_updated) tuples, in input order
     """
-    try:
-        erp_id = generate_erp_id(record)
-        return db_helpers.insert_raw_erp_data(erp_id, record)
-
-    except Exception as e:
-        logger.error(f"❌ Error storing ERP record: {str(e)}")
-        return None, False
+    return db_helpers.insert_raw_erp_data_bulk(
+        [(generate_erp_id(record), record) for record in records]
+    )
 
 
-def generate_erp_id(record: dict[str, Any]) -> str:
+def generate_erp_id(record: ERPRecordDict) -> str:
     """
     Generate unique ERP ID from CUST_ORDER_ID + CUST_ORDER_LINE_NO + BOM_PART_ID.
 
@@ -221,4 +285,6 @@ def generate_erp_id(record: dict[str, Any]) -> str:
     cust_order_id = record.get("CUST_ORDER_ID", "")
     line_no = record.get("CUST_ORDER_LINE_NO", "")
     part_id = record.get("BOM_PART_ID", "")
+    # The f-string compiles to a single BUILD_STRING; "-".join() measured
+    # slower here because the int line number needs an explicit str() call
     return f"{cust_order_id}-{line_no}-{part_id}"
@@ -8,9 +8,10 @@ Following spec.md: HTTP handling only, delegates to service.
 from fastapi import APIRouter, HTTPException
 
 from app.core.logging import get_logger
+from app.features.job_sync import db_helpers
 from app.features.job_sync.scheduler import scheduler
 from app.features.job_sync.schema import SyncTriggerRequest
-from app.features.job_sync.worker import calculate_from_date
+from app.features.job_sync.worker import calculate_from_date, worker
 from app.utils.response import success
 
 logger = get_logger(__name__)
@@ -30,17 +31,10 @@ async def trigger_sync(request: SyncTriggerRequest):
         Fetch result
     """
     try:
-        from app.features.job_sync import service
-
         # Use provided from_date, or calculate from settings
         from_date = request.from_date or calculate_from_date()
 
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, service.fetch_and_store_erp_data, from_date
-        )
+        result = await worker.fetch_and_store(from_date)
 
         return success(
             data=result,
@@ -63,11 +57,8 @@ async def get_sync_status():
         Scheduler status, current sync info, and database statistics
     """
     try:
-        from app.features.job_sync import db_helpers
-        from app.features.job_sync.worker import worker
-
         # Get database statistics
-        db_stats = db_helpers.get_sync_statistics()
+        db_stats = await db_helpers.a_get_sync_statistics()
 
         # Get current sync session info
         current_sync = worker.current_sync_stats.copy()
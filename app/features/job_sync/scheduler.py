@@ -6,7 +6,7 @@ Simplified to delegate to worker module.
 """
 
 from app.core.logging import get_logger
-from app.features.job_sync.worker import worker
+from app.features.job_sync.worker import SyncWorker, worker
 
 logger = get_logger(__name__)
 
@@ -14,15 +14,20 @@ logger = get_logger(__name__)
 class SyncScheduler:
     """Scheduler facade for sync worker."""
 
+    __slots__ = ("_worker",)
+
+    def __init__(self, sync_worker: SyncWorker = worker):
+        self._worker = sync_worker
+
     @property
     def is_running(self) -> bool:
         """Check if scheduler is running."""
-        return worker.is_running
+        return self._worker.is_running
 
     @property
     def sync_in_progress(self) -> bool:
         """Check if sync is in progress (always delegate to worker)."""
-        return worker.is_running
+        return self._worker.is_running
 
     def start(self, run_immediately: bool = False) -> None:
         """
@@ -31,12 +36,12 @@ class SyncScheduler:
         Args:
             run_immediately: Run fetch immediately on start
         """
-        worker.start(run_fetch_immediately=run_immediately)
+        self._worker.start(run_fetch_immediately=run_immediately)
         logger.info("Sync scheduler started")
 
     async def stop(self) -> None:
         """Stop the scheduler/worker."""
-        await worker.stop()
+        await self._worker.stop()
         logger.info("Sync scheduler stopped")
 
 
@@ -6,7 +6,7 @@ Following spec.md: Only data shapes, no logic, no DB calls.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -76,6 +76,76 @@ class ERPRecord(BaseModel):
     INV_TRANS_CREATE_DATE: Optional[datetime] = None
 
 
+class ERPRecordDict(TypedDict, total=False):
+    """
+    Raw ERP API record as decoded JSON.
+
+    Typing-only counterpart of ERPRecord for the ingest path, which stores
+    records as-is; dates are the API's ISO strings.
+    """
+
+    TXN_TYPE: Optional[str]
+    CUST_ORDER_ID: Optional[str]
+    CUST_ORDER_LINE_NO: Optional[int]
+    CUST_ORDER_DATE: Optional[str]
+    CUST_ORDER_WANT_DATE: Optional[str]
+    CUST_ORDER_LINE_WANT_DATE: Optional[str]
+    CUST_ORDER_STATUS: Optional[str]
+    WO_ASSMB_PART_ID: Optional[str]
+    WO_ASSMB_QTY: Optional[float]
+    WO_CREATE_DATE: Optional[str]
+    WO_RLS_DATE: Optional[str]
+    WO_WANT_DATE: Optional[str]
+    WO_CLOSE_DATE: Optional[str]
+    WO_STATUS: Optional[str]
+    WO_PRODUCT_CODE: Optional[str]
+    WO_ASW_STATUS: Optional[str]
+    BOM_WORKORDER_TYPE: Optional[str]
+    BOM_WORKORDER_BASE_ID: str
+    BOM_WORKORDER_LOT_ID: Optional[str]
+    BOM_WORKORDER_SPLIT_ID: Optional[str]
+    BOM_WORKORDER_SUB_ID: str
+    BOM_OPERATION_SEQ_NO: Optional[int]
+    BOM_PIECE_NO: Optional[int]
+    BOM_PART_ID: Optional[str]
+    BOM_QTY: Optional[float]
+    PART_IS_MANUFACTURE: Optional[str]
+    PART_CATEGORY: Optional[str]
+    PART_QTY_ON_HAND_WHOLE: Optional[float]
+    PART_QTY_ON_ORDER_WHOLE: Optional[float]
+    PART_QTY_IN_DEMAND_WHOLE: Optional[float]
+    PART_LEADTIME_DAYS: Optional[float]
+    PURC_REQ_ID: Optional[str]
+    PURC_REQ_LINE_NO: Optional[int]
+    PURC_REQ_PART_ID: Optional[str]
+    PURC_REQ_QTY: Optional[float]
+    PURC_REQ_DATE: Optional[str]
+    PURC_REQ_WANT_DATE: Optional[str]
+    PURC_ORDER_ID: Optional[str]
+    PO_LINE_NO: Optional[int]
+    PO_QTY: Optional[float]
+    PURC_ORDER_DATE: Optional[str]
+    PURC_ORDER_STATUS: Optional[str]
+    PO_WANT_DATE: Optional[str]
+    PO_ETD: Optional[str]
+    PO_ETA: Optional[str]
+    GRN_ID: Optional[str]
+    GRN_LINE_NO: Optional[int]
+    GRN_QTY: Optional[float]
+    GRN_INSPECT_QTY: Optional[float]
+    GRN_REJECTED_QTY: Optional[float]
+    GRN_DATE: Optional[str]
+    GRN_CREATE_DATE: Optional[str]
+    GRN_INSPECTION_DATE: Optional[str]
+    INV_TRANS_ID: Optional[int]
+    INV_TRANS_PART_ID: Optional[str]
+    INV_TRANS_TYPE: Optional[str]
+    INV_TRANS_CLASS: Optional[str]
+    INV_TRANS_QTY: Optional[float]
+    INV_TRANS_DATE: Optional[str]
+    INV_TRANS_CREATE_DATE: Optional[str]
+
+
 class SyncJobStatus(BaseModel):
     """Sync job status response."""
 
@@ -6,7 +6,11 @@ Following spec.md and task.md: Fetch -> Store -> Queue -> Process.
 Each function under 30 lines with single responsibility.
 """
 
-from typing import Any
+import asyncio
+from operator import itemgetter
+from typing import Any, Callable
+
+import httpx
 
 from app.core.logging import get_logger
 from app.features.job_sync import db_helpers, repo
@@ -14,14 +18,76 @@ from app.features.job_sync.schema import ERPRecord
 
 logger = get_logger(__name__)
 
+# Jobs claimed per round; their PocketBase matches are fetched in bulk
+JOB_BATCH_SIZE = 500
+
+# PocketBase pushes in flight at once in aprocess_all_queued_jobs
+PUSH_CONCURRENCY = 16
+
+# Unique key fields every ERP record must carry, fetched in one C-level call
+_REQUIRED_FIELDS = itemgetter("CUST_ORDER_ID", "CUST_ORDER_LINE_NO", "BOM_PART_ID")
+
+
+class JobResultBuffer:
+    """
+    Coalesces job outcome writes into batched transactions.
+
+    Done jobs, failed jobs, push-log rows and new PocketBase record links
+    are held in memory and written in one record_job_results transaction
+    after each batch processed by aprocess_all_queued_jobs.
+    """
+
+    def __init__(self):
+        self.done_ids: list[int] = []
+        self.failures: list[tuple[int, str]] = []
+        self.push_logs: list[tuple[int, int, str]] = []
+        self.pb_links: list[tuple[str, int]] = []
 
-def fetch_and_store_erp_data(from_date: str | None = None) -> dict[str, int]:
+    def record(self, job_id: int, response_code: int, response_body: str) -> None:
+        """Buffer a push result without flushing."""
+        if response_code == 200:
+            self.done_ids.append(job_id)
+        else:
+            self.failures.append((job_id, response_body))
+        self.push_logs.append((job_id, response_code, response_body))
+
+    def link(self, payload_ref: int, pb_record_id: str) -> None:
+        """Buffer the PocketBase record ID a stored payload was pushed to."""
+        self.pb_links.append((pb_record_id, payload_ref))
+
+    def take(
+        self,
+    ) -> tuple[
+        list[int],
+        list[tuple[int, str]],
+        list[tuple[int, int, str]],
+        list[tuple[str, int]],
+    ]:
+        """Detach and return the buffered (done_ids, failures, push_logs, pb_links)."""
+        buffered = (self.done_ids, self.failures, self.push_logs, self.pb_links)
+        self.done_ids = []
+        self.failures = []
+        self.push_logs = []
+        self.pb_links = []
+        return buffered
+
+    async def aflush(self) -> None:
+        """Write all buffered results on the SQLite writer thread."""
+        await db_helpers.a_record_job_results(*self.take())
+
+
+def fetch_and_store_erp_data(
+    from_date: str | None = None,
+    on_jobs_queued: Callable[[], None] | None = None,
+) -> dict[str, int]:
     """
     Fetch ERP data and store in SQLite.
 
     Args:
         from_date: Optional start date in YYYY-MM-DD format.
                    Only used if provided.
+        on_jobs_queued: Optional callback run after each chunk that queued
+                        jobs (e.g. to wake the job processor)
 
     Returns:
         Dict with counts of records stored and queued
@@ -31,89 +97,121 @@ def fetch_and_store_erp_data(from_date: str | None = None) -> dict[str, int]:
             logger.info(f"Fetching ERP data from {from_date}")
         else:
             logger.info("Fetching ERP data (no date filter)")
-        erp_records = repo.fetch_erp_data(from_date)
+        totals = {"fetched": 0, "stored": 0, "queued": 0}
 
-        stored_count = 0
-        queued_count = 0
+        # Each streamed chunk is stored while the rest of the response downloads
+        for erp_records in repo.iter_erp_records(from_date):
+            stored_count, queued_count = store_erp_records(erp_records)
+            totals["fetched"] += len(erp_records)
+            totals["stored"] += stored_count
+            totals["queued"] += queued_count
+            if queued_count and on_jobs_queued:
+                on_jobs_queued()
 
-        for record in erp_records:
-            if not validate_required_fields(record):
-                logger.warning("⚠️  Skipping invalid record")
-                continue
+        db_helpers.checkpoint_wal()
 
-            payload_id, is_updated = repo.store_erp_record_in_sqlite(record)
-
-            if payload_id:
-                stored_count += 1
-                job_id = db_helpers.create_job_for_payload(
-                    payload_id, force_requeue=is_updated
-                )
-                if job_id:
-                    queued_count += 1
-
-        logger.info(f"✅ Stored {stored_count}, queued {queued_count} records")
-        return {
-            "fetched": len(erp_records),
-            "stored": stored_count,
-            "queued": queued_count,
-        }
+        logger.info(f"✅ Stored {totals['stored']}, queued {totals['queued']} records")
+        return totals
 
     except Exception as e:
         logger.error(f"❌ Error fetching and storing data: {str(e)}")
         return {"fetched": 0, "stored": 0, "queued": 0}
 
 
-def validate_required_fields(record: dict[str, Any]) -> bool:
+def store_erp_records(erp_records: list[dict[str, Any]]) -> tuple[int, int]:
     """
-    Validate ERP record has required unique key fields.
+    Validate, deduplicate, store and queue a chunk of ERP records.
 
     Args:
-        record: ERP record dict
+        erp_records: Raw ERP records
 
     Returns:
-        True if valid, False otherwise
+        Tuple of (stored_count, queued_count)
     """
-    required = ["CUST_ORDER_ID", "CUST_ORDER_LINE_NO", "BOM_PART_ID"]
-    return all(field in record and record[field] for field in required)
+    valid_records = [r for r in erp_records if validate_required_fields(r)]
+    skipped = len(erp_records) - len(valid_records)
+    if skipped:
+        logger.warning(f"⚠️  Skipping {skipped} invalid records")
+
+    unique_records = dedupe_records(valid_records)
+    stored = repo.store_erp_records_bulk(unique_records)
+    return queue_stored_records(stored)
 
 
-def process_queued_job(job: dict[str, Any]) -> bool:
+def dedupe_records(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
-    Process a single queued job.
+    Drop records sharing an ERP ID, keeping the last occurrence.
 
     Args:
-        job: Job dict with id and payload
+        records: Validated ERP records
 
     Returns:
-        True if successful, False otherwise
+        One record per ERP ID
     """
-    try:
-        job_id = job["id"]
-        payload = job["payload"]
+    unique = list({repo.generate_erp_id(r): r for r in records}.values())
 
-        logger.info(f"Processing job {job_id}")
+    duplicates = len(records) - len(unique)
+    if duplicates:
+        logger.info(
+            f"🧹 Dropped {duplicates} duplicate records "
+            f"({duplicates / len(records):.1%} of batch)"
+        )
+    return unique
 
-        pb_data = transform_to_pocketbase(payload)
-        success = push_to_pocketbase(payload, pb_data)
 
-        if success:
-            db_helpers.mark_job_done(job_id)
-            db_helpers.log_push_result(job_id, 200, "Success")
-            logger.info(f"✅ Job {job_id} completed")
-            return True
-        else:
-            error_msg = "Failed to push to PocketBase"
-            db_helpers.mark_job_failed(job_id, error_msg)
-            db_helpers.log_push_result(job_id, 500, error_msg)
-            logger.error(f"❌ Job {job_id} failed: {error_msg}")
-            return False
+def queue_stored_records(
+    stored: list[tuple[int, bool] | tuple[None, bool]]
+) -> tuple[int, int]:
+    """
+    Create or requeue jobs for stored payloads.
 
-    except Exception as e:
-        error_msg = f"Job processing error: {str(e)}"
-        logger.error(f"❌ {error_msg}")
-        db_helpers.mark_job_failed(job["id"], error_msg)
-        db_helpers.log_push_result(job["id"], 500, error_msg)
+    Args:
+        stored: (payload_id, is_updated) tuples from the bulk store
+
+    Returns:
+        Tuple of (stored_count, queued_count)
+    """
+    payloads = [
+        (payload_id, is_updated) for payload_id, is_updated in stored if payload_id
+    ]
+    if not payloads:
+        return 0, 0
+
+    return len(payloads), db_helpers.create_jobs_bulk(payloads)
+
+
+def validate_required_fields(record: dict[str, Any]) -> bool:
+    """
+    Validate ERP record has required unique key fields.
+
+    Args:
+        record: ERP record dict
+
+    Returns:
+        True if valid, False otherwise
+    """
+    try:
+        values = _REQUIRED_FIELDS(record)
+    except KeyError:
         return False
+    return all(values)
+
+
+def link_pb_record(
+    job: dict[str, Any], pb_record_id: str, results: JobResultBuffer
+) -> None:
+    """
+    Remember which PocketBase record a job's payload was pushed to.
+
+    Later jobs for the same payload then update it without a lookup.
+
+    Args:
+        job: Processed job dict
+        pb_record_id: PocketBase record ID returned by the push
+        results: Result buffer
+    """
+    if pb_record_id != job.get("pb_record_id"):
+        results.link(job["payload_ref"], pb_record_id)
 
 
 def transform_to_pocketbase(payload: dict[str, Any]) -> dict[str, Any]:
@@ -127,67 +225,181 @@ def transform_to_pocketbase(payload: dict[str, Any]) -> dict[str, Any]:
         Transformed dict
     """
     try:
-        erp_record = ERPRecord(**payload)
-        return erp_record.model_dump(mode="json", exclude_none=False)
+        # model_validate takes the dict as-is instead of unpacking it to kwargs
+        erp_record = ERPRecord.model_validate(payload)
+        return erp_record.model_dump(mode="json")
     except Exception as e:
         logger.error(f"❌ Transform error: {str(e)}")
         raise
 
 
-def push_to_pocketbase(
-    payload: dict[str, Any], pb_data: dict[str, Any]
-) -> bool:
+async def apush_to_pocketbase(
+    payload: dict[str, Any],
+    pb_data: dict[str, Any],
+    existing_records: dict[str, dict[str, Any]] | None = None,
+    pb_record_id: str | None = None,
+) -> str | None:
     """
     Push data to PocketBase (upsert).
 
     Args:
         payload: Original ERP payload
         pb_data: Transformed PocketBase data
+        existing_records: Optional prefetched records by erp_id; when
+                          omitted, the record is looked up individually
+        pb_record_id: PocketBase record ID from an earlier push; when
+                      given, the record is updated without a lookup
 
     Returns:
-        True if successful, False otherwise
+        PocketBase record ID if successful, None otherwise
     """
     try:
         cust_order_id = payload["CUST_ORDER_ID"]
         line_no = str(payload["CUST_ORDER_LINE_NO"])
         part_id = payload["BOM_PART_ID"]
 
-        existing = repo.find_existing_record(cust_order_id, line_no, part_id)
+        record = None
+        if pb_record_id:
+            record = await _aupdate_linked_record(pb_record_id, pb_data)
+        if record is None:
+            if existing_records is None or pb_record_id:
+                existing = await repo.afind_existing_record(
+                    cust_order_id, line_no, part_id
+                )
+            else:
+                existing = existing_records.get(repo.generate_erp_id(payload))
 
-        if existing:
-            repo.update_record(existing["id"], pb_data)
-            logger.info(f"🔄 Updated {cust_order_id}-{line_no}-{part_id}")
-        else:
-            repo.create_record(pb_data)
-            logger.info(f"➕ Created {cust_order_id}-{line_no}-{part_id}")
+            if existing:
+                record = await repo.aupdate_record(existing["id"], pb_data)
+            else:
+                record = await repo.acreate_record(pb_data)
+                logger.info(f"➕ Created {cust_order_id}-{line_no}-{part_id}")
+                return record["id"]
 
-        return True
+        logger.info(f"🔄 Updated {cust_order_id}-{line_no}-{part_id}")
+        return record["id"]
 
     except Exception as e:
         logger.error(f"Push to PocketBase failed: {str(e)}")
-        return False
+        return None
+
+
+async def _aupdate_linked_record(
+    pb_record_id: str, pb_data: dict[str, Any]
+) -> dict[str, Any] | None:
+    """
+    Update a record by its stored PocketBase ID.
+
+    Returns:
+        The updated record, or None if it no longer exists
+    """
+    try:
+        return await repo.aupdate_record(pb_record_id, pb_data)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 404:
+            raise
+        logger.warning(f"⚠️  Linked record {pb_record_id} is gone, looking it up")
+        return None
+
+
+async def aprocess_queued_job(
+    job: dict[str, Any],
+    results: JobResultBuffer,
+    existing_records: dict[str, dict[str, Any]] | None = None,
+) -> bool:
+    """
+    Process a single queued job.
+
+    Results are buffered for the caller to flush.
+
+    Args:
+        job: Job dict with id and payload
+        results: Result buffer
+        existing_records: Optional prefetched PocketBase records by erp_id
+
+    Returns:
+        True if successful, False otherwise
+    """
+    job_id = job["id"]
+    try:
+        payload = job["payload"]
+        pb_data = transform_to_pocketbase(payload)
+
+        pb_record_id = await apush_to_pocketbase(
+            payload, pb_data, existing_records, job.get("pb_record_id")
+        )
+        if pb_record_id:
+            link_pb_record(job, pb_record_id, results)
+            results.record(job_id, 200, "Success")
+            logger.info(f"✅ Job {job_id} completed")
+            return True
+        error_msg = "Failed to push to PocketBase"
+
+    except Exception as e:
+        error_msg = f"Job processing error: {str(e)}"
+
+    logger.error(f"❌ Job {job_id} failed: {error_msg}")
+    results.record(job_id, 500, error_msg)
+    return False
+
+
+async def aprocess_job_batch(
+    jobs: list[dict[str, Any]], results: JobResultBuffer
+) -> int:
+    """
+    Push a batch of claimed jobs with at most PUSH_CONCURRENCY in flight.
+
+    Args:
+        jobs: Claimed jobs
+        results: Result buffer
+
+    Returns:
+        Number of jobs that succeeded
+    """
+    # Jobs linked to a PocketBase record are updated by ID, no lookup needed
+    payloads = [job["payload"] for job in jobs if not job.get("pb_record_id")]
+    try:
+        existing_records = (
+            await repo.abulk_find_existing(payloads) if payloads else {}
+        )
+    except Exception as e:
+        logger.warning(f"⚠️  Bulk lookup failed, using per-job lookups: {str(e)}")
+        existing_records = None
+
+    semaphore = asyncio.Semaphore(PUSH_CONCURRENCY)
 
+    async def run(job: dict[str, Any]) -> bool:
+        async with semaphore:
+            return await aprocess_queued_job(job, results, existing_records)
 
-def process_all_queued_jobs() -> dict[str, int]:
+    outcomes = await asyncio.gather(*(run(job) for job in jobs))
+    return sum(outcomes)
+
+
+async def aprocess_all_queued_jobs() -> dict[str, int]:
     """
-    Process all queued jobs.
+    Process all queued jobs with concurrent PocketBase pushes.
 
     Returns:
         Dict with success and failure counts
     """
     success_count = 0
     failure_count = 0
+    results = JobResultBuffer()
 
-    while True:
-        job = db_helpers.get_next_queued_job()
-
-        if not job:
-            break
-
-        if process_queued_job(job):
-            success_count += 1
-        else:
-            failure_count += 1
+    try:
+        while True:
+            jobs = await db_helpers.a_claim_jobs(JOB_BATCH_SIZE)
+
+            if not jobs:
+                break
+
+            succeeded = await aprocess_job_batch(jobs, results)
+            success_count += succeeded
+            failure_count += len(jobs) - succeeded
+            await results.aflush()
+    finally:
+        await results.aflush()
 
     logger.info(f"Processed: {success_count} success, {failure_count} failed")
     return {"success": success_count, "failed": failure_count}
@@ -6,7 +6,8 @@ Handles fetch, queue, and processing with crash recovery.
 """
 
 import asyncio
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
 from app.core.logging import get_logger
 from app.core.settings import settings
@@ -14,6 +15,12 @@ from app.features.job_sync import db_helpers, service
 
 logger = get_logger(__name__)
 
+# Days-back from_date for the current UTC day: (utc_date, from_date)
+_from_date_cache: tuple[date, str] | None = None
+
+# Fetch threads: the scheduled fetch plus one manual trigger
+FETCH_THREADS = 2
+
 
 class SyncWorker:
     """Worker for ERP sync operations."""
@@ -23,6 +30,15 @@ class SyncWorker:
         self.fetch_task: asyncio.Task | None = None
         self.process_task: asyncio.Task | None = None
         self.reaper_task: asyncio.Task | None = None
+        # Consecutive polls that found no jobs, drives the idle backoff
+        self._empty_polls = 0
+        # Set when jobs are queued in-process, so processing starts without
+        # waiting out the poll delay
+        self._jobs_available = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Fetches run here, not in the default executor shared with
+        # FastAPI's sync routes
+        self._executor: ThreadPoolExecutor | None = None
 
         # Current sync session statistics
         self.current_sync_stats = {
@@ -44,6 +60,10 @@ class SyncWorker:
         """
         if not self.is_running:
             self.is_running = True
+            self._loop = asyncio.get_running_loop()
+            self._executor = ThreadPoolExecutor(
+                max_workers=FETCH_THREADS, thread_name_prefix="sync-fetch"
+            )
             self.fetch_task = asyncio.create_task(
                 self._fetch_loop(run_fetch_immediately)
             )
@@ -63,8 +83,46 @@ class SyncWorker:
                 except asyncio.CancelledError:
                     pass
 
+        # A fetch thread that outlives the tasks must not notify a dead loop
+        self._loop = None
+        if self._executor:
+            # Don't block the loop on an in-flight fetch; drop queued ones
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("Sync worker stopped")
 
+    def notify_jobs_queued(self) -> None:
+        """Wake the process loop; safe to call from any thread."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._jobs_available.set)
+        except RuntimeError:
+            # Event loop already closed during shutdown
+            pass
+
+    async def fetch_and_store(self, from_date: str | None) -> dict[str, int]:
+        """
+        Run service.fetch_and_store_erp_data on the fetch threads.
+
+        Args:
+            from_date: Optional start date in YYYY-MM-DD format
+
+        Returns:
+            Dict with counts of records fetched, stored and queued
+        """
+        if self._executor is None:
+            # Worker not started (e.g. disabled): use the default executor
+            return await asyncio.to_thread(
+                service.fetch_and_store_erp_data, from_date, self.notify_jobs_queued
+            )
+        return await self._loop.run_in_executor(
+            self._executor,
+            service.fetch_and_store_erp_data,
+            from_date,
+            self.notify_jobs_queued,
+        )
+
     async def _fetch_loop(self, run_immediately: bool = False) -> None:
         """
         Fetch ERP data periodically.
@@ -110,10 +168,7 @@ class SyncWorker:
             else:
                 logger.info("📥 Fetching ERP data (no date filter)")
 
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, service.fetch_and_store_erp_data, from_date
-            )
+            result = await self.fetch_and_store(from_date)
 
             # Update sync statistics
             self.current_sync_stats["total_fetched"] = result.get(
@@ -135,31 +190,79 @@ class SyncWorker:
             logger.error(f"❌ Fetch error: {str(e)}")
 
     async def _process_loop(self) -> None:
-        """Process queued jobs continuously."""
+        """Process queued jobs continuously, polling faster while busy."""
         while self.is_running:
             try:
-                await asyncio.sleep(5)
-                await self._run_processing()
+                result = await self._run_processing()
+                await self._wait_for_jobs(self._poll_delay(result))
             except Exception as e:
                 logger.error(f"❌ Process loop error: {str(e)}")
                 await asyncio.sleep(10)
 
-    async def _run_processing(self) -> None:
-        """Run job processing."""
+    async def _wait_for_jobs(self, timeout: float) -> None:
+        """
+        Wait until jobs are queued in-process or the poll delay elapses.
+
+        The timeout still bounds the wait so retries coming due and jobs
+        reset by the reaper are picked up.
+
+        Args:
+            timeout: Poll delay in seconds (0 just yields to the event loop)
+        """
+        if timeout <= 0:
+            await asyncio.sleep(0)
+            return
+
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, service.process_all_queued_jobs
-            )
+            await asyncio.wait_for(self._jobs_available.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._jobs_available.clear()
+
+    def _poll_delay(self, result: dict[str, int]) -> float:
+        """
+        Get the delay before the next processing poll.
+
+        Args:
+            result: Counts returned by _run_processing
+
+        Returns:
+            0 after a poll that processed jobs, otherwise an exponential
+            backoff from process_poll_min up to process_poll_max
+        """
+        if result["success"] + result["failed"] > 0:
+            self._empty_polls = 0
+            return 0
+
+        delay = min(
+            settings.process_poll_max,
+            settings.process_poll_min * 2 ** self._empty_polls,
+        )
+        if delay < settings.process_poll_max:
+            self._empty_polls += 1
+        return delay
+
+    async def _run_processing(self) -> dict[str, int]:
+        """
+        Run job processing.
+
+        Returns:
+            Dict with success and failure counts (zeros on error)
+        """
+        try:
+            result = await service.aprocess_all_queued_jobs()
 
             if result["success"] > 0 or result["failed"] > 0:
                 logger.info(
                     f"⚙️  Processing complete: {result['success']} success, "
                     f"{result['failed']} failed"
                 )
+            return result
 
         except Exception as e:
             logger.error(f"❌ Processing error: {str(e)}")
+            return {"success": 0, "failed": 0}
 
     async def _reaper_loop(self) -> None:
         """Reset stuck jobs periodically."""
@@ -174,10 +277,7 @@ class SyncWorker:
     async def _run_reaper(self) -> None:
         """Run reaper to reset stuck jobs."""
         try:
-            loop = asyncio.get_event_loop()
-            count = await loop.run_in_executor(
-                None, db_helpers.reset_stuck_jobs, 10
-            )
+            count = await db_helpers.a_reset_stuck_jobs(10)
 
             if count > 0:
                 logger.warning(f"⚠️  Reaper reset {count} stuck jobs")
@@ -197,15 +297,33 @@ def calculate_from_date() -> str | None:
     if settings.erp_sync_from_date:
         return settings.erp_sync_from_date
 
-    # Priority 2: Calculate from days_back if set
+    # Priority 2: Calculate from days_back if set (changes once per UTC day)
     if settings.erp_sync_days_back:
-        from_date = datetime.now(timezone.utc) - timedelta(
-            days=settings.erp_sync_days_back
-        )
-        return from_date.strftime("%Y-%m-%d")
+        return _days_back_from_date(datetime.now(timezone.utc).date())
 
     # Priority 3: No date filter configured
     return None
 
 
+def _days_back_from_date(today: date) -> str:
+    """
+    Get today minus erp_sync_days_back as YYYY-MM-DD, memoized per day.
+
+    Args:
+        today: Current UTC date
+
+    Returns:
+        Date string in YYYY-MM-DD format
+    """
+    global _from_date_cache
+
+    cached = _from_date_cache
+    if cached is not None and cached[0] == today:
+        return cached[1]
+
+    from_date = (today - timedelta(days=settings.erp_sync_days_back)).isoformat()
+    _from_date_cache = (today, from_date)
+    return from_date
+
+
 worker = SyncWorker()
@@ -48,7 +48,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Register middlewares (order matters - logging should be first)
+    # Register middlewares. add_middleware prepends, so the last one added
+    # runs outermost: CORS answers preflight OPTIONS requests before they
+    # reach request logging. Keep CORS added last.
     app.add_middleware(RequestLoggingMiddleware)
     app.add_middleware(
         CORSMiddleware,
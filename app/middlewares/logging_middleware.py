@@ -1,19 +1,26 @@
-import time
-import uuid
-from typing import Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-
-from app.core.logging import clear_request_context, get_logger, set_request_context
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import (
+    clear_request_context,
+    elapsed_ms,
+    get_logger,
+    new_request_id,
+    set_request_context,
+    start_request_timer,
+)
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware for structured request/response logging.
 
+    Plain ASGI middleware: unlike BaseHTTPMiddleware it adds no task group
+    or response stream per request, and reads the status code from the
+    http.response.start message.
+
     Logs all HTTP requests with mandatory fields:
     - timestamp
     - level
@@ -32,19 +39,22 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - ERROR: Client/server errors (4xx/5xx)
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log with structured format."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Generate unique request ID
-        request_id = str(uuid.uuid4())[:8]
+        request_id = new_request_id()
 
         # Extract client IP (handle proxies)
-        client_ip = (
-            request.headers.get("X-Forwarded-For", "").split(",")[0].strip()
-            or request.headers.get("X-Real-IP")
-            or request.client.host
-            if request.client
-            else "unknown"
-        )
+        client_ip = self._get_client_ip(request)
 
         # Set request context for all logs during this request
         request_context = {
@@ -59,22 +69,41 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request.state.request_id = request_id
 
         # Log request start (DEBUG level - only in development)
-        logger.debug(f"Request started: {request.method} {request.url.path}")
+        logger.debug("Request started: %s %s", request.method, request.url.path)
 
-        # Process request and measure time
-        start_time = time.time()
-        response = await call_next(request)
-        duration_ms = int((time.time() - start_time) * 1000)
+        # Stays 500 if the app raises before starting a response
+        status_code = 500
+        request_id_header = (b"x-request-id", request_id.encode())
 
-        # Add request_id to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                # Add request_id to response headers
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
 
+        # Process request and measure time
+        start_ns = start_request_timer()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration_ms = elapsed_ms(start_ns)
+            self._log_response(request, status_code, duration_ms)
+
+            # Clear request context
+            clear_request_context()
+
+    def _log_response(
+        self, request: Request, status_code: int, duration_ms: int
+    ) -> None:
+        """Log the completed request at a level chosen by _get_log_level."""
         # Determine log level based on status code and duration
-        status_code = response.status_code
         log_level = self._get_log_level(status_code, duration_ms)
 
-        # Prepare log data
-        log_message = f"{request.method} {request.url.path} - {status_code} ({duration_ms}ms)"
+        # Prepare log data; the message is only interpolated if it is emitted
+        log_message = "%s %s - %s (%sms)"
+        log_args = (request.method, request.url.path, status_code, duration_ms)
 
         # Log with appropriate level
         log_data = {
@@ -83,16 +112,32 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         }
 
         if log_level == "INFO":
-            logger.info(log_message, extra={"extra_fields": log_data})
+            logger.info(log_message, *log_args, extra={"extra_fields": log_data})
         elif log_level == "WARNING":
-            logger.warning(log_message, extra={"extra_fields": log_data})
+            logger.warning(log_message, *log_args, extra={"extra_fields": log_data})
         elif log_level == "ERROR":
-            logger.error(log_message, extra={"extra_fields": log_data})
+            logger.error(log_message, *log_args, extra={"extra_fields": log_data})
 
-        # Clear request context
-        clear_request_context()
+    def _get_client_ip(self, request: Request) -> str:
+        """
+        Get the originating client IP.
 
-        return response
+        Prefers the first X-Forwarded-For hop, then X-Real-IP, then the
+        socket peer address.
+        """
+        headers = request.headers
+        forwarded_for = headers.get("x-forwarded-for")
+        if forwarded_for:
+            # partition stops at the first comma instead of splitting every hop
+            first_hop = forwarded_for.partition(",")[0].strip()
+            if first_hop:
+                return first_hop
+
+        real_ip = headers.get("x-real-ip")
+        if real_ip:
+            return real_ip
+
+        return request.client.host if request.client else "unknown"
 
     def _get_log_level(self, status_code: int, duration_ms: int) -> str:
         """
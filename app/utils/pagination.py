@@ -1,9 +1,45 @@
-def paginate(items: list, page: int, size: int) -> dict:
-    start = (page - 1) * size
-    end = start + size
+from collections.abc import Iterable, Sized
+from itertools import islice
+
+
+def paginate(
+    items: Iterable, page: int, size: int, total: int | None = None
+) -> dict:
+    """
+    Build one page from a list or any lazy iterable.
+
+    Only the requested page is materialized.
+
+    Args:
+        items: Source items (list, generator, DB cursor, ...)
+        page: 1-based page number
+        size: Items per page
+        total: Known total count (e.g. from SELECT COUNT(*)); when omitted it
+               is taken from len() or counted while scanning
+
+    Returns:
+        dict: items, page, size and total
+    """
+    # Out-of-range page/size give an empty page (islice rejects negatives)
+    start = max((page - 1) * size, 0)
+    end = max(page * size, start)
+
+    if total is None and isinstance(items, Sized):
+        total = len(items)
+
+    if total is not None:
+        page_items = list(islice(items, start, end))
+    else:
+        # Unknown length: count while scanning, keeping only the page
+        page_items = []
+        total = 0
+        for total, item in enumerate(items, start=1):
+            if start < total <= end:
+                page_items.append(item)
+
     return {
-        "items": items[start:end],
+        "items": page_items,
         "page": page,
         "size": size,
-        "total": len(items),
+        "total": total,
     }
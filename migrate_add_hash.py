@@ -5,18 +5,25 @@ Run this once to update existing database.
 """
 
 import hashlib
-import json
 import sqlite3
 from pathlib import Path
 
+import orjson
+import zstandard
+
 DB_PATH = Path("data/job_sync.db")
 
+# One decompressor for the whole run instead of one per row
+_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
 
-def calculate_hash(payload_json: str) -> str:
-    """Calculate MD5 hash of JSON payload."""
-    payload = json.loads(payload_json)
-    sorted_json = json.dumps(payload, sort_keys=True)
-    return hashlib.md5(sorted_json.encode()).hexdigest()
+def calculate_hash(payload_json: bytes | str) -> str:
+    """Calculate BLAKE2b-128 hash of JSON payload (matches calculate_payload_hash)."""
+    if isinstance(payload_json, bytes):
+        payload_json = _DECOMPRESSOR.decompress(payload_json)
+    payload = orjson.loads(payload_json)
+    sorted_json = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(sorted_json, digest_size=16).hexdigest()
 
 
 def migrate():
@@ -27,6 +34,9 @@ def migrate():
 
     conn = sqlite3.connect(str(DB_PATH))
     cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
 
     # Check if column already exists
     cursor.execute("PRAGMA table_info(erp_raw_data)")
@@ -46,13 +56,13 @@ def migrate():
     cursor.execute("SELECT id, payload_json FROM erp_raw_data")
     rows = cursor.fetchall()
 
-    for record_id, payload_json in rows:
-        payload_hash = calculate_hash(payload_json)
-        cursor.execute(
-            "UPDATE erp_raw_data SET payload_hash = ? WHERE id = ?",
-            (payload_hash, record_id),
-        )
+    # One prepared UPDATE for every row, all in the migration's transaction
+    cursor.executemany(
+        "UPDATE erp_raw_data SET payload_hash = ? WHERE id = ?",
+        [(calculate_hash(payload_json), record_id) for record_id, payload_json in rows],
+    )
 
+    # Built after the UPDATE so the index is created once from final values
     print("Creating index on payload_hash...")
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_payload_hash "
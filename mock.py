@@ -1,23 +1,107 @@
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Response
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from operator import itemgetter
 import random
 import datetime
 
+import orjson
+
 # -----------------------------
 # In-memory storage
 # -----------------------------
+# Each record is a tuple of values in FIELDS order: far smaller than a
+# 54-key dict. Rows become dicts only when a page is encoded.
 DATASET = []
 
+# Record fields in API output order
+FIELDS = (
+    "TXN_TYPE", "CUST_ORDER_ID", "CUST_ORDER_LINE_NO", "CUST_ORDER_DATE",
+    "CUST_ORDER_WANT_DATE", "CUST_ORDER_LINE_WANT_DATE", "CUST_ORDER_STATUS",
+    "WO_ASSMB_PART_ID", "WO_ASSMB_QTY", "WO_CREATE_DATE", "WO_RLS_DATE",
+    "WO_WANT_DATE", "WO_STATUS", "WO_PRODUCT_CODE", "WO_ASW_STATUS",
+    "BOM_WORKORDER_TYPE", "BOM_WORKORDER_BASE_ID", "BOM_WORKORDER_LOT_ID",
+    "BOM_WORKORDER_SPLIT_ID", "BOM_WORKORDER_SUB_ID", "BOM_OPERATION_SEQ_NO",
+    "BOM_PIECE_NO", "BOM_PART_ID", "BOM_QTY",
+    "PART_IS_MANUFACTURE", "PART_CATEGORY",
+    "PURC_REQ_ID", "PURC_REQ_LINE_NO", "PURC_REQ_PART_ID", "PURC_REQ_QTY",
+    "PURC_REQ_DATE", "PURC_REQ_WANT_DATE",
+    "PURC_ORDER_ID", "PO_LINE_NO", "PO_QTY", "PURC_ORDER_DATE",
+    "PURC_ORDER_STATUS", "PO_WANT_DATE", "PO_ETD", "PO_ETA",
+    "GRN_ID", "GRN_LINE_NO", "GRN_QTY", "GRN_INSPECT_QTY", "GRN_REJECTED_QTY",
+    "GRN_DATE", "GRN_CREATE_DATE",
+    "INV_TRANS_ID", "INV_TRANS_PART_ID", "INV_TRANS_TYPE", "INV_TRANS_CLASS",
+    "INV_TRANS_QTY", "INV_TRANS_DATE", "INV_TRANS_CREATE_DATE",
+)
+
+# Builds a FIELDS-ordered row tuple from a record dict in one C call
+ROW_VALUES = itemgetter(*FIELDS)
+
 
 # -----------------------------
 # Utils
 # -----------------------------
-def random_date(start_year=2023, end_year=2026):
+# Random date fields, in the order they appear in a record
+DATE_FIELDS = (
+    "CUST_ORDER_DATE", "CUST_ORDER_WANT_DATE", "CUST_ORDER_LINE_WANT_DATE",
+    "WO_CREATE_DATE", "WO_RLS_DATE", "WO_WANT_DATE",
+    "PURC_REQ_DATE", "PURC_REQ_WANT_DATE",
+    "PURC_ORDER_DATE", "PO_WANT_DATE", "PO_ETD", "PO_ETA",
+    "GRN_DATE", "GRN_CREATE_DATE",
+    "INV_TRANS_DATE", "INV_TRANS_CREATE_DATE",
+)
+
+# Fields that are the same on every record; copied instead of rebuilt
+PROTOTYPE = {
+    # Customer
+    "TXN_TYPE": "SALE",
+    "CUST_ORDER_STATUS": "OPEN",
+
+    # Work Order
+    "WO_STATUS": "RELEASED",
+    "WO_ASW_STATUS": "ON_TRACK",
+
+    # BOM (Main Rule)
+    "BOM_WORKORDER_TYPE": "MFG",
+    "BOM_WORKORDER_SPLIT_ID": "0",
+    "BOM_PIECE_NO": 1,
+    "BOM_QTY": 1,
+
+    # Part
+    "PART_IS_MANUFACTURE": True,
+    "PART_CATEGORY": "MECHANICAL",
+
+    # PR
+    "PURC_REQ_LINE_NO": 1,
+    "PURC_REQ_QTY": 1,
+
+    # PO
+    "PO_LINE_NO": 1,
+    "PO_QTY": 1,
+    "PURC_ORDER_STATUS": "CONFIRMED",
+
+    # GRN
+    "GRN_LINE_NO": 1,
+    "GRN_QTY": 1,
+    "GRN_INSPECT_QTY": 1,
+    "GRN_REJECTED_QTY": 0,
+
+    # Inventory
+    "INV_TRANS_TYPE": "IN",
+    "INV_TRANS_CLASS": "RAW",
+    "INV_TRANS_QTY": 1,
+}
+
+
+def date_pool(start_year=2023, end_year=2026):
+    """Every date in the range, rendered once as YYYY-MM-DD."""
     start = datetime.date(start_year, 1, 1)
     end = datetime.date(end_year, 12, 31)
 
-    delta = end - start
-    return str(start + datetime.timedelta(days=random.randint(0, delta.days)))
+    return [
+        str(start + datetime.timedelta(days=offset))
+        for offset in range((end - start).days + 1)
+    ]
 
 
 def init_data(
@@ -32,6 +116,12 @@ def init_data(
     if DATASET:
         return
 
+    total = total_customers * lines_per_customer * subs_per_line
+
+    # All random values drawn up front in two calls instead of per field
+    dates = iter(random.choices(date_pool(), k=total * len(DATE_FIELDS)))
+    quantities = random.choices(range(1, 101), k=total)
+
     record_id = 1
 
     for cust_no in range(1, total_customers + 1):
@@ -46,81 +136,31 @@ def init_data(
             # Sub IDs: 0,1,2,3...
             for sub_id in range(subs_per_line):
 
-                DATASET.append({
-
-                    # Customer
-                    "TXN_TYPE": "SALE",
+                record = PROTOTYPE.copy()
+                record.update({
                     "CUST_ORDER_ID": cust_order_id,
                     "CUST_ORDER_LINE_NO": line_no,
-                    "CUST_ORDER_DATE": random_date(),
-                    "CUST_ORDER_WANT_DATE": random_date(),
-                    "CUST_ORDER_LINE_WANT_DATE": random_date(),
-                    "CUST_ORDER_STATUS": "OPEN",
-
-                    # Work Order
                     "WO_ASSMB_PART_ID": f"ASM-{record_id}",
-                    "WO_ASSMB_QTY": random.randint(1, 100),
-                    "WO_CREATE_DATE": random_date(),
-                    "WO_RLS_DATE": random_date(),
-                    "WO_WANT_DATE": random_date(),
-                    "WO_STATUS": "RELEASED",
+                    "WO_ASSMB_QTY": quantities[record_id - 1],
                     "WO_PRODUCT_CODE": f"PROD-{record_id}",
-                    "WO_ASW_STATUS": "ON_TRACK",
-
-                    # BOM (Main Rule)
-                    "BOM_WORKORDER_TYPE": "MFG",
                     "BOM_WORKORDER_BASE_ID": base_id,
                     "BOM_WORKORDER_LOT_ID": f"L{record_id}",
-                    "BOM_WORKORDER_SPLIT_ID": "0",
 
                     # IMPORTANT
                     "BOM_WORKORDER_SUB_ID": str(sub_id),
 
                     "BOM_OPERATION_SEQ_NO": 10 + sub_id,
-                    "BOM_PIECE_NO": 1,
                     "BOM_PART_ID": f"PART-{record_id}",
-                    "BOM_QTY": 1,
-
-                    # Part
-                    "PART_IS_MANUFACTURE": True,
-                    "PART_CATEGORY": "MECHANICAL",
-
-                    # PR
                     "PURC_REQ_ID": f"PR-{record_id}",
-                    "PURC_REQ_LINE_NO": 1,
                     "PURC_REQ_PART_ID": f"PART-{record_id}",
-                    "PURC_REQ_QTY": 1,
-                    "PURC_REQ_DATE": random_date(),
-                    "PURC_REQ_WANT_DATE": random_date(),
-
-                    # PO
                     "PURC_ORDER_ID": f"PO-{record_id}",
-                    "PO_LINE_NO": 1,
-                    "PO_QTY": 1,
-                    "PURC_ORDER_DATE": random_date(),
-                    "PURC_ORDER_STATUS": "CONFIRMED",
-                    "PO_WANT_DATE": random_date(),
-                    "PO_ETD": random_date(),
-                    "PO_ETA": random_date(),
-
-                    # GRN
                     "GRN_ID": f"GRN-{record_id}",
-                    "GRN_LINE_NO": 1,
-                    "GRN_QTY": 1,
-                    "GRN_INSPECT_QTY": 1,
-                    "GRN_REJECTED_QTY": 0,
-                    "GRN_DATE": random_date(),
-                    "GRN_CREATE_DATE": random_date(),
-
-                    # Inventory
                     "INV_TRANS_ID": f"IT-{record_id}",
                     "INV_TRANS_PART_ID": f"PART-{record_id}",
-                    "INV_TRANS_TYPE": "IN",
-                    "INV_TRANS_CLASS": "RAW",
-                    "INV_TRANS_QTY": 1,
-                    "INV_TRANS_DATE": random_date(),
-                    "INV_TRANS_CREATE_DATE": random_date(),
                 })
+                # zip stops at DATE_FIELDS, taking exactly one date per field
+                record.update(zip(DATE_FIELDS, dates))
+                DATASET.append(ROW_VALUES(record))
 
                 record_id += 1
 
@@ -131,8 +171,10 @@ def init_data(
 async def lifespan(app: FastAPI):
 
     init_data()   # Startup
+    encode_page.cache_clear()
     yield
     DATASET.clear()  # Shutdown
+    encode_page.cache_clear()
 
 
 # -----------------------------
@@ -144,20 +186,28 @@ app = FastAPI(lifespan=lifespan)
 # -----------------------------
 # API
 # -----------------------------
-@app.get("/api/erp-records")
-def get_erp_records(
-    page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=500)
-):
+@lru_cache(maxsize=64)
+def encode_page(page, page_size):
+    """Serialize one page of DATASET; the data never changes while serving."""
     total = len(DATASET)
 
     start = (page - 1) * page_size
     end = start + page_size
 
-    return {
+    return orjson.dumps({
         "page": page,
         "page_size": page_size,
         "total_records": total,
         "total_pages": (total + page_size - 1) // page_size,
-        "records": DATASET[start:end],
-    }
+        "records": [dict(zip(FIELDS, row)) for row in DATASET[start:end]],
+    })
+
+
+@app.get("/api/erp-records")
+def get_erp_records(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500)
+):
+    return Response(
+        content=encode_page(page, page_size), media_type="application/json"
+    )
@@ -1,3 +1,4 @@
+import orjson
 import requests
 
 url = "http://127.0.0.1:8080/data"
@@ -7,7 +8,8 @@ params = {
 }
 
 response = requests.get(url, params=params)
-data = response.json()
+# orjson parses the raw bytes, skipping requests' text decode and stdlib json
+data = orjson.loads(response.content)
 
 # 1. Total records (with duplicates)
 total_records = len(data)
@@ -0,0 +1,104 @@
+"""
+Job sync SQLite helper tests.
+
+Each test runs against a fresh database file under pytest's tmp_path.
+"""
+
+import pytest
+
+from app.features.job_sync import db_helpers, db_schema
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the job sync store at a fresh database and yield its connection."""
+    monkeypatch.setattr(db_schema, "DB_PATH", tmp_path / "job_sync.db")
+    # Drop connections cached by this thread so the new path is opened
+    db_schema.close_connection()
+    db_helpers._STORED_HASH_CACHE.clear()
+    db_schema.init_database()
+
+    yield db_schema.get_connection()
+
+    db_schema.close_connection()
+    db_helpers._STORED_HASH_CACHE.clear()
+
+
+def _record(line_no: int, qty: int = 100) -> dict:
+    return {
+        "CUST_ORDER_ID": "SO-1",
+        "CUST_ORDER_LINE_NO": line_no,
+        "BOM_PART_ID": "P-1",
+        "BOM_QTY": qty,
+    }
+
+
+def _fetched_at(conn, erp_id: str) -> str:
+    row = conn.execute(
+        "SELECT fetched_at FROM erp_raw_data WHERE erp_id = ?", (erp_id,)
+    ).fetchone()
+    return row[0]
+
+
+def test_insert_bulk_detects_unchanged_records(db):
+    first = db_helpers.insert_raw_erp_data_bulk([("a", _record(1)), ("b", _record(2))])
+    assert [is_updated for _, is_updated in first] == [False, False]
+    fetched_at = _fetched_at(db, "a")
+
+    # Checked against the stored hashes, not just the in-process cache
+    db_helpers._STORED_HASH_CACHE.clear()
+    again = db_helpers.insert_raw_erp_data_bulk(
+        [("a", _record(1)), ("b", _record(2, qty=99))]
+    )
+
+    assert again == [(first[0][0], False), (first[1][0], True)]
+    assert _fetched_at(db, "a") == fetched_at
+    stored = db.execute(
+        "SELECT payload_json FROM erp_raw_data WHERE erp_id = 'b'"
+    ).fetchone()[0]
+    assert db_helpers.load_stored_payload(stored)["BOM_QTY"] == 99
+
+
+def test_claim_jobs_claims_each_job_once(db):
+    stored = db_helpers.insert_raw_erp_data_bulk([("a", _record(1)), ("b", _record(2))])
+    assert db_helpers.create_jobs_bulk(stored) == 2
+
+    jobs = db_helpers.claim_jobs(10)
+
+    assert sorted(job["payload_ref"] for job in jobs) == sorted(ref for ref, _ in stored)
+    assert {job["payload"]["CUST_ORDER_LINE_NO"] for job in jobs} == {1, 2}
+    assert all(job["pb_record_id"] is None for job in jobs)
+    assert db_helpers.claim_jobs(10) == []
+    statuses = db.execute("SELECT status FROM job_queue").fetchall()
+    assert [row[0] for row in statuses] == ["processing", "processing"]
+
+
+def test_record_job_results_writes_outcomes_and_pb_link(db):
+    stored = db_helpers.insert_raw_erp_data_bulk([("a", _record(1)), ("b", _record(2))])
+    db_helpers.create_jobs_bulk(stored)
+    done, failed = sorted(db_helpers.claim_jobs(10), key=lambda job: job["id"])
+
+    db_helpers.record_job_results(
+        [done["id"]],
+        [(failed["id"], "boom")],
+        [(done["id"], 200, "Success"), (failed["id"], 500, "boom")],
+        [("pb123", done["payload_ref"])],
+    )
+
+    jobs = {
+        row[0]: tuple(row[1:])
+        for row in db.execute(
+            "SELECT id, status, retry_count, last_error FROM job_queue"
+        )
+    }
+    assert jobs[done["id"]] == ("done", 0, None)
+    assert jobs[failed["id"]] == ("queued", 1, "boom")
+    assert db.execute("SELECT COUNT(*) FROM push_log").fetchone()[0] == 2
+
+    # A changed payload requeues the done job, which now carries the link
+    db_helpers._STORED_HASH_CACHE.clear()
+    requeue = db_helpers.insert_raw_erp_data_bulk([("a", _record(1, qty=5))])
+    assert db_helpers.create_jobs_bulk(requeue) == 1
+    [job] = db_helpers.claim_jobs(10)
+    assert job["id"] == done["id"]
+    assert job["pb_record_id"] == "pb123"
@@ -0,0 +1,41 @@
+"""
+paginate() tests for list, lazy iterable and known-total sources.
+"""
+
+import pytest
+
+from app.utils.pagination import paginate
+
+
+def test_paginate_list():
+    result = paginate(list(range(25)), page=3, size=10)
+
+    assert result == {"items": [20, 21, 22, 23, 24], "page": 3, "size": 10, "total": 25}
+
+
+def test_paginate_generator_counts_total_while_scanning():
+    result = paginate((n for n in range(25)), page=2, size=10)
+
+    assert result["items"] == list(range(10, 20))
+    assert result["total"] == 25
+
+
+def test_paginate_explicit_total_only_reads_the_page():
+    consumed = []
+
+    def source():
+        for n in range(1000):
+            consumed.append(n)
+            yield n
+
+    result = paginate(source(), page=2, size=5, total=1000)
+
+    assert result["items"] == [5, 6, 7, 8, 9]
+    assert result["total"] == 1000
+    assert len(consumed) == 10
+
+
+@pytest.mark.parametrize("page, size", [(0, 10), (-1, 10), (1, 0), (2, -5)])
+def test_paginate_out_of_range_gives_empty_page(page, size):
+    assert paginate(list(range(25)), page=page, size=size)["items"] == []
+    assert paginate(iter(range(25)), page=page, size=size)["items"] == []